@@ -19,6 +19,7 @@ import os
 import re
 import signal
 import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from enum import Enum
@@ -140,7 +141,7 @@ class CircuitBreaker:
         self.timeout = timeout
         self.expected_exception = expected_exception
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic()
         self.state = CircuitBreakerState.CLOSED
         self._lock = asyncio.Lock()
 
@@ -148,7 +149,7 @@ class CircuitBreaker:
         async with self._lock:
             if self.state == CircuitBreakerState.OPEN:
                 if self.last_failure_time and (
-                    datetime.now().timestamp() - self.last_failure_time > self.timeout
+                    time.monotonic() - self.last_failure_time > self.timeout
                 ):
                     logger.info("circuit_breaker_half_open")
                     self.state = CircuitBreakerState.HALF_OPEN
@@ -172,7 +173,7 @@ class CircuitBreaker:
         except self.expected_exception as e:
             async with self._lock:
                 self.failure_count += 1
-                self.last_failure_time = datetime.now().timestamp()
+                self.last_failure_time = time.monotonic()
 
                 if self.failure_count >= self.failure_threshold:
                     logger.error(
@@ -213,17 +214,21 @@ PII_PATTERNS = {
 }
 
 
+# Replacement strings are fixed per pattern, so build them once
+PII_REPLACEMENTS = [
+    (pattern, f"\\1=[REDACTED_{pii_type.upper()}]" if pii_type == "api_key" else f"[REDACTED_{pii_type.upper()}]")
+    for pii_type, pattern in PII_PATTERNS.items()
+]
+
+
 def redact_pii(text: str) -> str:
     """Redact PII from text"""
     if not text:
         return text
 
     redacted = text
-    for pii_type, pattern in PII_PATTERNS.items():
-        if pii_type == "api_key":
-            redacted = pattern.sub(f"\\1=[REDACTED_{pii_type.upper()}]", redacted)
-        else:
-            redacted = pattern.sub(f"[REDACTED_{pii_type.upper()}]", redacted)
+    for pattern, replacement in PII_REPLACEMENTS:
+        redacted = pattern.sub(replacement, redacted)
 
     return redacted
 
@@ -343,7 +348,7 @@ class AIClient:
     )
     async def classify_batch(self, items: List[DataItem]) -> List[Classification]:
         """Classify a batch of items using AI API"""
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         # Build prompt
         prompt = self._build_prompt(items)
@@ -366,7 +371,7 @@ class AIClient:
                 },
             )
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             api_call_duration.observe(duration)
 
             if response.status_code != 200:
@@ -549,24 +554,26 @@ app = FastAPI(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests with PII redaction"""
-    start_time = datetime.now()
+    start_time = time.monotonic()
     request_id = request.headers.get("X-Request-ID", "unknown")
+    # Redacted once; both log lines reuse it
+    path = redact_pii(str(request.url.path))
 
     logger.info(
         "request_started",
         method=request.method,
-        path=redact_pii(str(request.url.path)),
+        path=path,
         request_id=request_id,
     )
 
     response = await call_next(request)
 
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.monotonic() - start_time
 
     logger.info(
         "request_completed",
         method=request.method,
-        path=redact_pii(str(request.url.path)),
+        path=path,
         status_code=response.status_code,
         duration=duration,
         request_id=request_id,
@@ -647,8 +654,8 @@ async def sort_data(batch: BatchRequest):
     - Redacts PII in logs
     - Records metrics
     """
-    start_time = datetime.now()
-    request_id = batch.request_id or f"req-{datetime.now().timestamp()}"
+    start_time = time.monotonic()
+    request_id = batch.request_id or f"req-{time.time()}"
 
     # Check API key
     if not GROK_API_KEY:
@@ -674,7 +681,7 @@ async def sort_data(batch: BatchRequest):
         raise HTTPException(status_code=503, detail="Service at capacity, try again later")
 
 
-async def _process_batch(batch: BatchRequest, request_id: str, start_time: datetime) -> BatchResponse:
+async def _process_batch(batch: BatchRequest, request_id: str, start_time: float) -> BatchResponse:
     """Internal batch processing with metrics"""
     active_requests.inc()
 
@@ -690,8 +697,8 @@ async def _process_batch(batch: BatchRequest, request_id: str, start_time: datet
         failure_count = 0
 
         for item, classification in zip(batch.items, classifications):
-            item_start = datetime.now()
-            processing_time = (datetime.now() - item_start).total_seconds() * 1000
+            item_start = time.monotonic()
+            processing_time = (time.monotonic() - item_start) * 1000
 
             sorted_item = SortedItem(
                 item=item,
@@ -708,7 +715,7 @@ async def _process_batch(batch: BatchRequest, request_id: str, start_time: datet
             # Record metrics
             items_classified_total.labels(category=classification.category.value).inc()
 
-        total_duration = (datetime.now() - start_time).total_seconds()
+        total_duration = time.monotonic() - start_time
         request_duration.observe(total_duration)
         requests_total.labels(status="success").inc()
 
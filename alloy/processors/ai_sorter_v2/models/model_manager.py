@@ -10,17 +10,38 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 import structlog
 
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; fall back to JSON storage
+    msgpack = None
+
 from .model_version import (
     ModelVersion, ModelDeployment, ModelConfiguration, ModelMetrics,
-    ModelStatus, DeploymentStrategy
+    ModelStatus, DeploymentStrategy, STATUS_VALUES, STRATEGY_VALUES, dumps_json_bytes
 )
 
 logger = structlog.get_logger(__name__)
 
+# Zeroed counter templates for get_model_statistics
+_DEPLOYMENT_STRATEGY_ZEROS = dict.fromkeys(STRATEGY_VALUES.values(), 0)
+_MODEL_STATUS_ZEROS = dict.fromkeys(STATUS_VALUES.values(), 0)
+
+
+def _aggregate_versions(versions: List[ModelVersion]) -> Tuple[int, float, float]:
+    """Sum requests and cost and average health score over a model's versions"""
+    if not versions:
+        return 0, 0.0, 0.0
+    
+    total_requests = sum(v.metrics.total_requests for v in versions)
+    total_cost = sum((v.metrics.total_cost for v in versions), 0.0)
+    avg_health_score = sum(v.calculate_health_score() for v in versions) / len(versions)
+    return total_requests, total_cost, avg_health_score
+
 
 @dataclass
 class ModelManagerConfig:
@@ -63,8 +84,20 @@ class ModelVersionManager:
         
         # Model storage
         self._models: Dict[str, List[ModelVersion]] = {}  # model_name -> list of versions
+        self._versions: Dict[str, Dict[str, ModelVersion]] = {}  # model_name -> version -> model version
         self._active_models: Dict[str, ModelVersion] = {}  # model_name -> active version
+        self._latest_models: Dict[str, ModelVersion] = {}  # model_name -> most recently created version
         self._ab_tests: Dict[str, Dict[str, Any]] = {}  # test_id -> test configuration
+        self._unloaded_files: Dict[str, Dict[str, Path]] = {}  # model_name -> version -> model file not yet parsed
+        self._catalog: Dict[str, List[str]] = {}  # model_name -> versions stored on disk
+        self._legacy_json_stems: set = set()  # JSON model files to replace on next msgpack save
+        
+        # Read-only view handed out by list_all_models (avoids copying per call)
+        self._models_view = MappingProxyType(self._models)
+        
+        # Status/strategy totals, maintained at write time
+        self._status_counts: Dict[str, int] = _MODEL_STATUS_ZEROS.copy()
+        self._strategy_counts: Dict[str, int] = _DEPLOYMENT_STRATEGY_ZEROS.copy()
         
         # Background tasks
         self._health_monitor_task: Optional[asyncio.Task] = None
@@ -81,53 +114,189 @@ class ModelVersionManager:
     
     def _initialize_storage(self):
         """Initialize storage backend"""
+        # Resolve storage paths once; save/load reuse them
+        storage_path = Path(self.config.storage_path)
+        self._models_dir = storage_path / "models"
+        self._deployments_dir = storage_path / "deployments"
+        self._backups_dir = storage_path / "backups"
+        self._active_index_path = storage_path / "active.json"
+        self._catalog_path = storage_path / "catalog.json"
+        
         if self.config.storage_backend == "file":
             # Create storage directory
-            storage_path = Path(self.config.storage_path)
             storage_path.mkdir(parents=True, exist_ok=True)
             
             # Create subdirectories
-            (storage_path / "models").mkdir(exist_ok=True)
-            (storage_path / "deployments").mkdir(exist_ok=True)
-            (storage_path / "backups").mkdir(exist_ok=True)
+            self._models_dir.mkdir(exist_ok=True)
+            self._deployments_dir.mkdir(exist_ok=True)
+            self._backups_dir.mkdir(exist_ok=True)
             
             # Load existing models
             self._load_models_from_storage()
     
     def _load_models_from_storage(self):
-        """Load existing models from storage"""
+        """Load existing models from storage
+        
+        When the active index and version catalog are present only the active
+        versions are parsed up front; the remaining files are loaded on first
+        access. File stems are "<model>_<version>" with the registry name,
+        which is ambiguous between models whose names share a prefix, so
+        deferred files are attributed to a model through the catalog rather
+        than by their names.
+        """
         try:
-            models_path = Path(self.config.storage_path) / "models"
+            models_path = self._models_dir
+            model_files = {model_file.stem: model_file for model_file in models_path.glob("*.json")}
+            if msgpack is not None:
+                self._legacy_json_stems = set(model_files)
+                # msgpack files take precedence over JSON files with the same name
+                model_files.update((model_file.stem, model_file) for model_file in models_path.glob("*.mpk"))
+            active_index = self._read_index_file(self._active_index_path)
+            catalog = self._read_index_file(self._catalog_path)
             
-            for model_file in models_path.glob("*.json"):
-                try:
-                    with open(model_file, 'r') as f:
-                        model_data = json.load(f)
-                    
-                    model_version = ModelVersion.from_dict(model_data)
-                    model_name = model_version.configuration.model_name
-                    
-                    if model_name not in self._models:
-                        self._models[model_name] = []
-                    
-                    self._models[model_name].append(model_version)
-                    
-                    # Set as active if it's the active deployment
+            if active_index is None or catalog is None:
+                # No index yet: scan every version once and write the indexes
+                for model_file in model_files.values():
+                    model_version = self._load_model_file(model_file)
+                    if model_version is None:
+                        continue
+                    model_name = model_version.name
+                    self._catalog.setdefault(model_name, []).append(model_version.version)
                     if model_version.status == ModelStatus.ACTIVE:
                         self._active_models[model_name] = model_version
-                    
-                    logger.debug("Loaded model version from storage",
-                               model_name=model_name,
-                               version=model_version.version)
                 
-                except Exception as e:
-                    logger.error("Error loading model file",
-                               file=model_file.name,
-                               error=str(e))
+                self._save_active_index()
+                self._save_catalog()
+                return
+            
+            self._catalog = catalog
+            for model_name, versions in catalog.items():
+                for version in versions:
+                    model_file = model_files.pop(f"{model_name}_{version}", None)
+                    if model_file is not None:
+                        self._unloaded_files.setdefault(model_name, {})[version] = model_file
+            
+            # Files missing from the catalog cannot be attributed without parsing them
+            for model_file in model_files.values():
+                model_version = self._load_model_file(model_file)
+                if model_version is not None:
+                    stored_versions = self._catalog.setdefault(model_version.name, [])
+                    if model_version.version not in stored_versions:
+                        stored_versions.append(model_version.version)
+            if model_files:
+                self._save_catalog()
+            
+            for model_name, pointer in active_index.items():
+                model_version = self.get_model_version(model_name, pointer["version"])
+                if model_version is None:
+                    logger.warning("Active model file missing",
+                                 model_name=model_name,
+                                 version=pointer["version"])
+                    continue
+                
+                self._active_models[model_name] = model_version
         
         except Exception as e:
             logger.error("Error loading models from storage", error=str(e))
     
+    def _load_model_file(self, model_file: Path) -> Optional[ModelVersion]:
+        """Parse a model file and register the version in memory"""
+        try:
+            if model_file.suffix == ".mpk":
+                with open(model_file, 'rb') as f:
+                    model_data = msgpack.unpackb(f.read(), raw=False)
+            else:
+                with open(model_file, 'r') as f:
+                    model_data = json.load(f)
+            
+            model_version = ModelVersion.from_dict(model_data)
+            model_name = model_version.name
+            
+            # Older stores named files after the provider model; move them to the registry stem
+            stem = model_version.storage_stem
+            if model_file.stem != stem:
+                os.replace(model_file, model_file.with_name(f"{stem}{model_file.suffix}"))
+                if model_file.stem in self._legacy_json_stems:
+                    self._legacy_json_stems.discard(model_file.stem)
+                    self._legacy_json_stems.add(stem)
+            
+            if model_name not in self._models:
+                self._models[model_name] = []
+                self._versions[model_name] = {}
+            
+            self._models[model_name].append(model_version)
+            self._versions[model_name][model_version.version] = model_version
+            self._track_latest(model_version)
+            self._count_version(model_version, 1)
+            
+            logger.debug("Loaded model version from storage",
+                       model_name=model_name,
+                       version=model_version.version)
+            
+            return model_version
+        
+        except Exception as e:
+            logger.error("Error loading model file",
+                       file=model_file.name,
+                       error=str(e))
+            return None
+    
+    def _load_deferred_versions(self, model_name: Optional[str] = None):
+        """Load model files skipped at startup (all models, or one model)"""
+        if not self._unloaded_files:
+            return
+        
+        if model_name is None:
+            unloaded = list(self._unloaded_files.values())
+            self._unloaded_files = {}
+        else:
+            model_files = self._unloaded_files.pop(model_name, None)
+            unloaded = [model_files] if model_files else []
+        
+        for model_files in unloaded:
+            for model_file in model_files.values():
+                self._load_model_file(model_file)
+    
+    def _read_index_file(self, index_path: Path) -> Optional[Dict[str, Any]]:
+        """Read a persisted JSON index (active versions or catalog), if any"""
+        if not index_path.exists():
+            return None
+        
+        try:
+            with open(index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable index", file=index_path.name, error=str(e))
+            return None
+    
+    def _write_index_file(self, index_path: Path, data: Dict[str, Any]):
+        """Write a JSON index atomically"""
+        if self.config.storage_backend != "file":
+            return
+        
+        try:
+            tmp_path = index_path.with_name(f"{index_path.name}.tmp")
+            
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            
+            # Atomic swap so a crash never leaves a half-written index
+            os.replace(tmp_path, index_path)
+        
+        except Exception as e:
+            logger.error("Error saving index", file=index_path.name, error=str(e))
+    
+    def _save_active_index(self):
+        """Persist the model_name -> active version index"""
+        self._write_index_file(self._active_index_path, {
+            model_name: {"model_id": model_version.model_id, "version": model_version.version}
+            for model_name, model_version in self._active_models.items()
+        })
+    
+    def _save_catalog(self):
+        """Persist the model_name -> stored versions catalog"""
+        self._write_index_file(self._catalog_path, self._catalog)
+    
     async def start(self):
         """Start background tasks"""
         try:
@@ -173,10 +342,8 @@ class ModelVersionManager:
         """Create a new model version"""
         try:
             # Check if version already exists
-            if model_name in self._models:
-                existing_versions = [mv.version for mv in self._models[model_name]]
-                if version in existing_versions:
-                    raise ValueError(f"Version {version} already exists for model {model_name}")
+            if self.get_model_version(model_name, version) is not None:
+                raise ValueError(f"Version {version} already exists for model {model_name}")
             
             # Create model version
             model_version = ModelVersion(
@@ -193,8 +360,12 @@ class ModelVersionManager:
             # Add to storage
             if model_name not in self._models:
                 self._models[model_name] = []
+                self._versions[model_name] = {}
             
             self._models[model_name].append(model_version)
+            self._versions[model_name][version] = model_version
+            self._track_latest(model_version)
+            self._count_version(model_version, 1)
             
             # Update parent-child relationships
             if parent_version:
@@ -204,6 +375,10 @@ class ModelVersionManager:
             
             # Save to storage
             await self._save_model_version(model_version)
+            stored_versions = self._catalog.setdefault(model_name, [])
+            if version not in stored_versions:
+                stored_versions.append(version)
+                self._save_catalog()
             
             logger.info("Model version created",
                        model_name=model_name,
@@ -259,28 +434,29 @@ class ModelVersionManager:
                 deployment.traffic_percentage = 100.0
                 
                 self._active_models[model_name] = model_version
-                model_version.status = ModelStatus.ACTIVE
+                self._set_version_status(model_version, ModelStatus.ACTIVE)
             
             elif strategy == DeploymentStrategy.CANARY:
                 # Start with small percentage
                 deployment.traffic_percentage = self.config.canary_rollout_step_percentage
                 deployment.status = ModelStatus.TESTING
-                model_version.status = ModelStatus.TESTING
+                self._set_version_status(model_version, ModelStatus.TESTING)
             
             elif strategy == DeploymentStrategy.A_B_TEST:
                 # Start A/B test
                 deployment.traffic_percentage = 50.0  # Split traffic
                 deployment.status = ModelStatus.TESTING
-                model_version.status = ModelStatus.TESTING
+                self._set_version_status(model_version, ModelStatus.TESTING)
                 
                 # Create A/B test configuration
                 await self._create_ab_test(model_name, version, deployment)
             
             # Add deployment to model
-            model_version.add_deployment(deployment)
+            self._add_deployment(model_version, deployment)
             
             # Save changes
             await self._save_model_version(model_version)
+            self._save_active_index()
             
             logger.info("Model version deployed",
                        model_name=model_name,
@@ -322,9 +498,9 @@ class ModelVersionManager:
             
             # Retire current model
             if current_model.current_deployment:
-                current_model.current_deployment.status = ModelStatus.RETIRED
+                current_model.set_deployment_status(current_model.current_deployment, ModelStatus.RETIRED)
                 current_model.current_deployment.retired_at = time.time()
-            current_model.status = ModelStatus.RETIRED
+            self._set_version_status(current_model, ModelStatus.RETIRED)
             
             # Activate target model
             rollback_deployment = ModelDeployment(
@@ -337,8 +513,8 @@ class ModelVersionManager:
             )
             rollback_deployment.activated_at = time.time()
             
-            target_model.add_deployment(rollback_deployment)
-            target_model.status = ModelStatus.ACTIVE
+            self._add_deployment(target_model, rollback_deployment)
+            self._set_version_status(target_model, ModelStatus.ACTIVE)
             self._active_models[model_name] = target_model
             
             # Add changelog entry
@@ -348,6 +524,7 @@ class ModelVersionManager:
             # Save changes
             await self._save_model_version(current_model)
             await self._save_model_version(target_model)
+            self._save_active_index()
             
             logger.warning("Model rollback executed",
                          model_name=model_name,
@@ -366,14 +543,18 @@ class ModelVersionManager:
     
     def get_model_version(self, model_name: str, version: str) -> Optional[ModelVersion]:
         """Get specific model version"""
-        if model_name not in self._models:
-            return None
+        versions = self._versions.get(model_name)
+        model_version = versions.get(version) if versions else None
         
-        for model_version in self._models[model_name]:
-            if model_version.version == version:
-                return model_version
+        if model_version is None and self._unloaded_files:
+            model_files = self._unloaded_files.get(model_name)
+            model_file = model_files.pop(version, None) if model_files else None
+            if model_file is not None:
+                if not model_files:
+                    del self._unloaded_files[model_name]
+                model_version = self._load_model_file(model_file)
         
-        return None
+        return model_version
     
     def get_active_model(self, model_name: str) -> Optional[ModelVersion]:
         """Get currently active model version"""
@@ -381,11 +562,17 @@ class ModelVersionManager:
     
     def list_model_versions(self, model_name: str) -> List[ModelVersion]:
         """List all versions of a model"""
+        self._load_deferred_versions(model_name)
         return self._models.get(model_name, [])
     
-    def list_all_models(self) -> Dict[str, List[ModelVersion]]:
-        """List all models and their versions"""
-        return self._models.copy()
+    def list_all_models(self) -> Mapping[str, List[ModelVersion]]:
+        """List all models and their versions
+        
+        Returns a live read-only view of the internal registry; callers must
+        treat it (and the version lists it contains) as immutable.
+        """
+        self._load_deferred_versions()
+        return self._models_view
     
     async def update_model_metrics(self, 
                                  model_name: str, 
@@ -395,29 +582,30 @@ class ModelVersionManager:
                                  confidence: float = 0.0,
                                  cost: float = 0.0):
         """Update metrics for a model version"""
-        try:
+        # Hot path: plain lookups, no try block. rollback_model and
+        # _save_model_version already guard and log their own failures.
+        versions = self._versions.get(model_name)
+        model_version = versions.get(version) if versions else None
+        if model_version is None:
+            # Slow path: the version may not have been loaded from disk yet
             model_version = self.get_model_version(model_name, version)
-            if model_version:
-                model_version.update_metrics(response_time, success, confidence, cost)
-                
-                # Check for rollback conditions
-                should_rollback, reason = model_version.should_rollback()
-                if should_rollback and model_version.status == ModelStatus.ACTIVE:
-                    logger.warning("Auto-rollback triggered",
-                                 model_name=model_name,
-                                 version=version,
-                                 reason=reason)
-                    await self.rollback_model(model_name, reason=f"Auto-rollback: {reason}")
-                
-                # Save updated metrics periodically
-                if model_version.metrics.total_requests % 100 == 0:  # Every 100 requests
-                    await self._save_model_version(model_version)
+            if model_version is None:
+                return
         
-        except Exception as e:
-            logger.error("Error updating model metrics",
-                        model_name=model_name,
-                        version=version,
-                        error=str(e))
+        model_version.update_metrics(response_time, success, confidence, cost)
+        
+        # Check for rollback conditions
+        should_rollback, reason = model_version.should_rollback()
+        if should_rollback and model_version.status == ModelStatus.ACTIVE:
+            logger.warning("Auto-rollback triggered",
+                         model_name=model_name,
+                         version=version,
+                         reason=reason)
+            await self.rollback_model(model_name, reason=f"Auto-rollback: {reason}")
+        
+        # Save updated metrics periodically
+        if model_version.metrics.total_requests % 100 == 0:  # Every 100 requests
+            await self._save_model_version(model_version)
     
     async def _create_ab_test(self, model_name: str, version: str, deployment: ModelDeployment):
         """Create A/B test configuration"""
@@ -449,6 +637,7 @@ class ModelVersionManager:
     
     def _find_previous_stable_version(self, model_name: str, current_version: str) -> Optional[str]:
         """Find the previous stable version for rollback"""
+        self._load_deferred_versions(model_name)
         if model_name not in self._models:
             return None
         
@@ -481,23 +670,64 @@ class ModelVersionManager:
         """Retire currently active model"""
         current_model = self._active_models.get(model_name)
         if current_model and current_model.current_deployment:
-            current_model.current_deployment.status = ModelStatus.RETIRED
+            current_model.set_deployment_status(current_model.current_deployment, ModelStatus.RETIRED)
             current_model.current_deployment.retired_at = time.time()
-            current_model.status = ModelStatus.RETIRED
+            self._set_version_status(current_model, ModelStatus.RETIRED)
             
             if model_name in self._active_models:
                 del self._active_models[model_name]
+            
+            self._save_active_index()
+    
+    def _track_latest(self, model_version: ModelVersion):
+        """Update the latest-version pointer for a newly added version"""
+        model_name = model_version.name
+        latest = self._latest_models.get(model_name)
+        if latest is None or model_version.created_at > latest.created_at:
+            self._latest_models[model_name] = model_version
+    
+    def _count_version(self, model_version: ModelVersion, delta: int):
+        """Add (1) or remove (-1) a version from the status/strategy counters"""
+        self._status_counts[STATUS_VALUES[model_version.status]] += delta
+        for strategy, count in model_version._strategy_counter.items():
+            self._strategy_counts[strategy] += delta * count
+    
+    def _set_version_status(self, model_version: ModelVersion, status: ModelStatus):
+        """Change a version's status, keeping the status counters in sync"""
+        self._status_counts[STATUS_VALUES[model_version.status]] -= 1
+        self._status_counts[STATUS_VALUES[status]] += 1
+        model_version.status = status
+    
+    def _add_deployment(self, model_version: ModelVersion, deployment: ModelDeployment):
+        """Attach a deployment to a version, keeping the counters in sync"""
+        previous_status = model_version.status
+        model_version.add_deployment(deployment)
+        self._strategy_counts[STRATEGY_VALUES[deployment.deployment_strategy]] += 1
+        
+        # add_deployment promotes the version when the deployment is active
+        if model_version.status is not previous_status:
+            self._status_counts[STATUS_VALUES[previous_status]] -= 1
+            self._status_counts[STATUS_VALUES[model_version.status]] += 1
     
     async def _save_model_version(self, model_version: ModelVersion):
         """Save model version to storage"""
         try:
             if self.config.storage_backend == "file":
-                models_path = Path(self.config.storage_path) / "models"
-                filename = f"{model_version.configuration.model_name}_{model_version.version}.json"
-                filepath = models_path / filename
+                models_path = self._models_dir
+                stem = model_version.storage_stem
+                
+                if msgpack is None:
+                    with open(models_path / f"{stem}.json", 'wb') as f:
+                        f.write(dumps_json_bytes(model_version.to_dict(), indent=True))
+                    return
                 
-                with open(filepath, 'w') as f:
-                    json.dump(model_version.to_dict(), f, indent=2)
+                with open(models_path / f"{stem}.mpk", 'wb') as f:
+                    f.write(msgpack.packb(model_version.to_dict(), use_bin_type=True))
+                
+                # Migrate: drop the JSON copy this version was loaded from
+                if stem in self._legacy_json_stems:
+                    self._legacy_json_stems.discard(stem)
+                    (models_path / f"{stem}.json").unlink(missing_ok=True)
         
         except Exception as e:
             logger.error("Error saving model version",
@@ -505,6 +735,17 @@ class ModelVersionManager:
                         version=model_version.version,
                         error=str(e))
     
+    def dump_json_export(self) -> str:
+        """Export every model version as indented JSON for human inspection
+        
+        Internal storage uses msgpack when available; JSON is kept for export only.
+        """
+        self._load_deferred_versions()
+        return dumps_json_bytes({
+            model_name: [model_version.to_dict() for model_version in versions]
+            for model_name, versions in self._models.items()
+        }, indent=True).decode()
+    
     async def _health_monitor_loop(self):
         """Background health monitoring loop"""
         while not self._shutdown_event.is_set():
@@ -524,7 +765,10 @@ class ModelVersionManager:
     
     async def _check_model_health(self):
         """Check health of all active models"""
-        for model_name, model_version in self._active_models.items():
+        # Scoring is synchronous; only the rollbacks it triggers do I/O, so
+        # those run concurrently once every model has been checked
+        rollbacks = []
+        for model_name, model_version in list(self._active_models.items()):
             try:
                 health_score = model_version.calculate_health_score()
                 
@@ -534,15 +778,26 @@ class ModelVersionManager:
                                  version=model_version.version,
                                  health_score=health_score)
                 
-                # Check rollback conditions
-                should_rollback, reason = model_version.should_rollback()
+                # Check rollback conditions; the periodic check bypasses the evaluation window
+                should_rollback, reason = model_version.should_rollback(force=True)
                 if should_rollback:
-                    await self.rollback_model(model_name, reason=f"Health check: {reason}")
+                    rollbacks.append((model_name, f"Health check: {reason}"))
             
             except Exception as e:
                 logger.error("Error checking model health",
                            model_name=model_name,
                            error=str(e))
+        
+        if rollbacks:
+            results = await asyncio.gather(
+                *(self.rollback_model(model_name, reason=reason) for model_name, reason in rollbacks),
+                return_exceptions=True
+            )
+            for (model_name, _), result in zip(rollbacks, results):
+                if isinstance(result, Exception):
+                    logger.error("Error checking model health",
+                               model_name=model_name,
+                               error=str(result))
     
     async def _rollout_manager_loop(self):
         """Background rollout management loop"""
@@ -563,6 +818,7 @@ class ModelVersionManager:
     
     async def _manage_rollouts(self):
         """Manage ongoing canary rollouts"""
+        self._load_deferred_versions()
         for model_name, model_versions in self._models.items():
             for model_version in model_versions:
                 if model_version.status == ModelStatus.TESTING:
@@ -590,7 +846,7 @@ class ModelVersionManager:
                 return
             
             # Check health metrics
-            should_rollback, reason = model_version.should_rollback()
+            should_rollback, reason = model_version.should_rollback(force=True)
             if should_rollback:
                 logger.warning("Canary rollout failed health check",
                              model_name=model_version.name,
@@ -609,9 +865,9 @@ class ModelVersionManager:
             
             # Check if rollout is complete
             if new_percentage >= deployment.target_traffic_percentage:
-                deployment.status = ModelStatus.ACTIVE
+                model_version.set_deployment_status(deployment, ModelStatus.ACTIVE)
                 deployment.activated_at = time.time()
-                model_version.status = ModelStatus.ACTIVE
+                self._set_version_status(model_version, ModelStatus.ACTIVE)
                 self._active_models[model_version.name] = model_version
                 
                 # Retire previous active model
@@ -654,6 +910,7 @@ class ModelVersionManager:
     async def _cleanup_old_versions(self):
         """Clean up old model versions based on retention policy"""
         try:
+            self._load_deferred_versions()
             current_time = time.time()
             retention_seconds = self.config.retention_days * 24 * 3600
             
@@ -688,7 +945,16 @@ class ModelVersionManager:
                 if versions_to_remove:
                     self._models[model_name] = versions_to_keep
                     
+                    # Versions are sorted newest first, so the head is the latest kept
+                    if versions_to_keep:
+                        self._latest_models[model_name] = versions_to_keep[0]
+                    else:
+                        self._latest_models.pop(model_name, None)
+                    
+                    version_index = self._versions[model_name]
                     for version in versions_to_remove:
+                        version_index.pop(version.version, None)
+                        self._count_version(version, -1)
                         logger.info("Cleaned up old model version",
                                    model_name=model_name,
                                    version=version.version,
@@ -697,65 +963,62 @@ class ModelVersionManager:
         except Exception as e:
             logger.error("Error during cleanup", error=str(e))
     
+    def get_global_counters(self) -> Dict[str, Dict[str, int]]:
+        """Get deployment strategy and model status counts across all models"""
+        self._load_deferred_versions()
+        return {
+            "deployment_strategies": self._strategy_counts.copy(),
+            "model_statuses": self._status_counts.copy()
+        }
+    
+    def get_model_summary(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """Get aggregated statistics for a single model"""
+        self._load_deferred_versions(model_name)
+        versions = self._models.get(model_name)
+        if versions is None:
+            return None
+        
+        total_requests, total_cost, avg_health_score = _aggregate_versions(versions)
+        model_stats = {
+            "total_versions": len(versions),
+            "active_version": None,
+            "latest_version": None,
+            "total_requests": total_requests,
+            "total_cost": total_cost,
+            "avg_health_score": avg_health_score
+        }
+        
+        # Set active and latest versions
+        active_model = self._active_models.get(model_name)
+        if active_model is not None:
+            model_stats["active_version"] = active_model.version
+        latest_model = self._latest_models.get(model_name)
+        if latest_model is not None:
+            model_stats["latest_version"] = latest_model.version
+        
+        return model_stats
+    
     def get_model_statistics(self) -> Dict[str, Any]:
         """Get comprehensive model statistics"""
-        try:
-            stats = {
-                "total_models": len(self._models),
-                "total_versions": sum(len(versions) for versions in self._models.values()),
-                "active_models": len(self._active_models),
-                "models": {},
-                "deployment_strategies": {strategy.value: 0 for strategy in DeploymentStrategy},
-                "model_statuses": {status.value: 0 for status in ModelStatus}
-            }
-            
-            for model_name, versions in self._models.items():
-                model_stats = {
-                    "total_versions": len(versions),
-                    "active_version": None,
-                    "latest_version": None,
-                    "total_requests": 0,
-                    "total_cost": 0.0,
-                    "avg_health_score": 0.0
-                }
-                
-                health_scores = []
-                for version in versions:
-                    # Count statuses
-                    stats["model_statuses"][version.status.value] += 1
-                    
-                    # Count deployment strategies
-                    for deployment in version.deployments:
-                        stats["deployment_strategies"][deployment.deployment_strategy.value] += 1
-                    
-                    # Aggregate metrics
-                    model_stats["total_requests"] += version.metrics.total_requests
-                    model_stats["total_cost"] += version.metrics.total_cost
-                    
-                    # Track health scores
-                    health_score = version.calculate_health_score()
-                    health_scores.append(health_score)
-                    
-                    # Set active and latest versions
-                    if version.status == ModelStatus.ACTIVE:
-                        model_stats["active_version"] = version.version
-                    
-                    if (model_stats["latest_version"] is None or 
-                        version.created_at > next(v.created_at for v in versions 
-                                                if v.version == model_stats["latest_version"])):
-                        model_stats["latest_version"] = version.version
-                
-                # Calculate average health score
-                if health_scores:
-                    model_stats["avg_health_score"] = sum(health_scores) / len(health_scores)
-                
-                stats["models"][model_name] = model_stats
-            
-            return stats
+        self._load_deferred_versions()
         
+        try:
+            models = {model_name: self.get_model_summary(model_name) for model_name in self._models}
         except Exception as e:
             logger.error("Error getting model statistics", error=str(e))
             return {"error": str(e)}
+        
+        counters = self.get_global_counters()
+        stats = {
+            "total_models": len(self._models),
+            "total_versions": sum(len(versions) for versions in self._models.values()),
+            "active_models": len(self._active_models),
+            "models": models,
+            "deployment_strategies": counters["deployment_strategies"],
+            "model_statuses": counters["model_statuses"]
+        }
+        
+        return stats
     
     def get_ab_test_results(self, test_id: str) -> Optional[Dict[str, Any]]:
         """Get A/B test results"""
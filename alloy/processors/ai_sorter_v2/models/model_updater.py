@@ -6,20 +6,48 @@ validation pipelines, and smart deployment strategies.
 """
 
 import asyncio
+import functools
+import heapq
 import json
+import operator
 import time
-from typing import Dict, List, Optional, Any, Callable
+import uuid
+from collections import Counter, OrderedDict, defaultdict, deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import structlog
 
-from .model_version import ModelVersion, ModelConfiguration, ModelStatus, DeploymentStrategy
+try:
+    from croniter import croniter
+except ImportError:  # croniter is optional; fall back to the simplified schedule parser
+    croniter = None
+
+from .model_version import (
+    ModelVersion, ModelConfiguration, ModelStatus, DeploymentStrategy,
+    STATUS_VALUES, STRATEGY_VALUES, dumps_json_bytes
+)
 from .model_manager import ModelVersionManager
 from .ab_testing import ABTestEngine
 
 logger = structlog.get_logger(__name__)
 
+# Active updates running longer than this are failed by the monitor
+_UPDATE_TIMEOUT_SECONDS = 3600
+
+# Strategies that go through a testing phase after deployment
+_TESTING_STRATEGIES: FrozenSet[DeploymentStrategy] = frozenset({DeploymentStrategy.CANARY, DeploymentStrategy.A_B_TEST})
+
+# Sort key for listing updates by creation time
+_CREATED_AT = operator.attrgetter("created_at")
+
+# Intervals (seconds) for known cron expressions when croniter is not installed
+_CRON_FALLBACK_INTERVALS: Dict[str, int] = {
+    "0 0 * * *": 86400,   # Daily at midnight
+    "0 */6 * * *": 21600  # Every 6 hours
+}
+
 
 class UpdateTrigger(Enum):
     """Model update triggers"""
@@ -42,7 +70,12 @@ class UpdateStatus(Enum):
     ROLLED_BACK = "rolled_back"
 
 
-@dataclass
+# Enum member -> value maps for serialization
+TRIGGER_VALUES = {trigger: trigger.value for trigger in UpdateTrigger}
+UPDATE_STATUS_VALUES = {status: status.value for status in UpdateStatus}
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationRule:
     """Model validation rule"""
     name: str
@@ -64,7 +97,7 @@ class ValidationRule:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation rule"""
     rule_name: str
@@ -73,18 +106,23 @@ class ValidationResult:
     execution_time_seconds: float
     details: Dict[str, Any] = field(default_factory=dict)
     
+    # Results are write-once, so the serialized form is built a single time
+    _dict_cache: Optional[Dict[str, Any]] = field(init=False, repr=False, compare=False, default=None)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "rule_name": self.rule_name,
-            "passed": self.passed,
-            "message": self.message,
-            "execution_time_seconds": self.execution_time_seconds,
-            "details": self.details
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "rule_name": self.rule_name,
+                "passed": self.passed,
+                "message": self.message,
+                "execution_time_seconds": self.execution_time_seconds,
+                "details": self.details
+            }
+        return self._dict_cache.copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelUpdate:
     """Model update information"""
     update_id: str
@@ -104,6 +142,10 @@ class ModelUpdate:
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
     
+    # Monotonic counterparts of started_at/completed_at, used for durations
+    started_monotonic: Optional[float] = field(default=None, repr=False, compare=False)
+    completed_monotonic: Optional[float] = field(default=None, repr=False, compare=False)
+    
     # Results
     validation_results: List[ValidationResult] = field(default_factory=list)
     deployment_id: Optional[str] = None
@@ -114,37 +156,58 @@ class ModelUpdate:
     triggered_by: str = "system"
     notes: List[str] = field(default_factory=list)
     
+    # Serialized form of a finished update, keyed on the fields that can still change
+    _dict_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(init=False, repr=False, compare=False, default=None)
+    
     @property
     def duration_minutes(self) -> float:
         """Get update duration in minutes"""
+        if self.started_monotonic is not None:
+            end_time = self.completed_monotonic if self.completed_monotonic is not None else time.monotonic()
+            return (end_time - self.started_monotonic) / 60
+        
         if not self.started_at:
             return 0.0
         end_time = self.completed_at or time.time()
         return (end_time - self.started_at) / 60
     
+    def mark_started(self):
+        """Record the start time (wall clock for display, monotonic for durations)"""
+        self.started_at = time.time()
+        self.started_monotonic = time.monotonic()
+    
+    def mark_completed(self):
+        """Record the completion time (wall clock for display, monotonic for durations)"""
+        self.completed_at = time.time()
+        self.completed_monotonic = time.monotonic()
+    
     @property
     def validation_passed(self) -> bool:
         """Check if validation passed"""
         if not self.validation_results:
             return False
         
-        # Check required validations
-        required_validations = [r for r in self.validation_rules if r.required]
-        required_results = [vr for vr in self.validation_results 
-                          if any(rv.name == vr.rule_name for rv in required_validations)]
+        # Check required validations; the rule list is small and can be
+        # replaced at any time, so the required set is built per call
+        required_names = {r.name for r in self.validation_rules if r.required}
         
-        return all(vr.passed for vr in required_results)
+        return all(vr.passed for vr in self.validation_results if vr.rule_name in required_names)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
+        # Finished updates are effectively frozen; reuse their serialized form
+        cache_key = (self.status, self.completed_at, len(self.validation_results), self.rollback_reason)
+        if self._dict_cache is not None and self._dict_cache[0] == cache_key:
+            return self._dict_cache[1].copy()
+        
+        data = {
             "update_id": self.update_id,
             "model_name": self.model_name,
             "current_version": self.current_version,
             "target_version": self.target_version,
-            "trigger": self.trigger.value,
-            "deployment_strategy": self.deployment_strategy.value,
-            "status": self.status.value,
+            "trigger": TRIGGER_VALUES[self.trigger],
+            "deployment_strategy": STRATEGY_VALUES[self.deployment_strategy],
+            "status": UPDATE_STATUS_VALUES[self.status],
             "created_at": self.created_at,
             "started_at": self.started_at,
             "completed_at": self.completed_at,
@@ -157,6 +220,78 @@ class ModelUpdate:
             "triggered_by": self.triggered_by,
             "notes": self.notes
         }
+        
+        if self.completed_at is not None:
+            self._dict_cache = (cache_key, data)
+            return data.copy()
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes"""
+        return dumps_json_bytes(self.to_dict())
+
+
+@functools.cache
+def _default_validation_rules() -> Tuple[ValidationRule, ...]:
+    """Default validation rules, built once and shared (ValidationRule is frozen)"""
+    return (
+        ValidationRule(
+            name="Model Configuration Validation",
+            description="Validate model configuration parameters",
+            validator_function="validate_model_configuration",
+            severity="error",
+            required=True
+        ),
+        ValidationRule(
+            name="Model Availability Check",
+            description="Check if target model version is available",
+            validator_function="validate_model_availability",
+            severity="error",
+            required=True
+        )
+    )
+
+
+def _check_model_configuration(config: ModelConfiguration) -> Tuple[bool, str, dict]:
+    """Basic bounds checks on a model configuration"""
+    if not config.provider:
+        return False, "Provider not specified", {}
+    
+    if not config.model_name:
+        return False, "Model name not specified", {}
+    
+    if config.temperature < 0 or config.temperature > 2:
+        return False, f"Invalid temperature: {config.temperature}", {}
+    
+    if config.max_tokens <= 0:
+        return False, f"Invalid max_tokens: {config.max_tokens}", {}
+    
+    return True, "Configuration validation passed", {
+        "provider": config.provider,
+        "model_name": config.model_name,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens
+    }
+
+
+@dataclass(slots=True)
+class ScheduleConfig:
+    """Recurring model update schedule"""
+    schedule_id: str
+    model_name: str
+    target_version: str
+    cron_expression: str
+    deployment_strategy: DeploymentStrategy
+    validation_rules: List[ValidationRule] = field(default_factory=list)
+    enabled: bool = True
+    last_run: Optional[float] = None
+    next_run: Optional[float] = None
+    
+    # Parsed cron iterator (croniter), when available
+    cron_iter: Any = field(default=None, repr=False, compare=False)
+    
+    # Additional caller-supplied schedule options
+    extra: Dict[str, Any] = field(default_factory=dict)
 
 
 class ModelUpdateAutomation:
@@ -172,14 +307,27 @@ class ModelUpdateAutomation:
         
         # Update tracking
         self._pending_updates: Dict[str, ModelUpdate] = {}
+        self._pending_order: Deque[str] = deque()  # FIFO of pending update IDs; cancelled IDs are skipped lazily
         self._active_updates: Dict[str, ModelUpdate] = {}
-        self._completed_updates: List[ModelUpdate] = []
+        self._timeout_heap: List[Tuple[float, str]] = []  # (monotonic deadline, update_id); finished IDs skipped on pop
+        self.max_completed_history = self.config.get("max_completed_history", 1000)
+        self._completed_updates: Deque[ModelUpdate] = deque(maxlen=self.max_completed_history)  # oldest dropped automatically
+        
+        # Lookup indices across pending, active and completed updates
+        self._update_by_id: Dict[str, ModelUpdate] = {}
+        self._updates_by_model: Dict[str, set] = defaultdict(set)  # model_name -> update IDs
+        self._updates_by_status: Dict[UpdateStatus, set] = defaultdict(set)  # status -> update IDs
         
         # Validation functions registry
         self._validators: Dict[str, Callable] = {}
         
+        # LRU of configuration validation outcomes, keyed by the validated fields
+        self._validation_cache: "OrderedDict[Tuple[Any, ...], Tuple[bool, str, dict]]" = OrderedDict()
+        self._validation_cache_size = self.config.get("validation_cache_size", 512)
+        
         # Update triggers and schedules
-        self._scheduled_updates: Dict[str, Dict[str, Any]] = {}
+        self._scheduled_updates: Dict[str, ScheduleConfig] = {}
+        self._schedule_heap: List[Tuple[float, str]] = []  # (next_run, schedule_id); stale entries skipped on pop
         self._performance_monitors: Dict[str, Dict[str, Any]] = {}
         
         # Background tasks
@@ -187,11 +335,18 @@ class ModelUpdateAutomation:
         self._processor_task: Optional[asyncio.Task] = None
         self._monitor_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
+        self._work_available = asyncio.Event()  # set when pending work arrives or a slot frees up
+        
+        # Guards pending -> active -> completed moves made from coroutines. The sync
+        # entry points (trigger_update, cancel_update) never await, so they already
+        # run atomically on the event loop.
+        self._state_lock = asyncio.Lock()
         
         # Configuration
         self.max_concurrent_updates = self.config.get("max_concurrent_updates", 3)
         self.default_validation_timeout = self.config.get("default_validation_timeout", 300)
         self.update_check_interval_minutes = self.config.get("update_check_interval_minutes", 60)
+        self.validation_fail_fast = self.config.get("validation_fail_fast", False)
         
         # Register default validators
         self._register_default_validators()
@@ -243,28 +398,31 @@ class ModelUpdateAutomation:
                        **kwargs):
         """Schedule automatic model updates"""
         try:
-            schedule_id = f"{model_name}_{target_version}_{int(time.time())}"
-            
-            schedule_config = {
-                "schedule_id": schedule_id,
-                "model_name": model_name,
-                "target_version": target_version,
-                "cron_expression": cron_expression,
-                "deployment_strategy": deployment_strategy,
-                "validation_rules": validation_rules or [],
-                "enabled": True,
-                "last_run": None,
-                "next_run": self._calculate_next_run(cron_expression),
-                **kwargs
-            }
+            schedule_id = f"{model_name}_{target_version}_{uuid.uuid4().hex[:12]}"
+            
+            # Parse the cron expression once; later runs re-anchor the iterator at the current time
+            cron_iter = croniter(cron_expression, time.time()) if croniter else None
+            
+            schedule_config = ScheduleConfig(
+                schedule_id=schedule_id,
+                model_name=model_name,
+                target_version=target_version,
+                cron_expression=cron_expression,
+                deployment_strategy=deployment_strategy,
+                validation_rules=validation_rules or [],
+                next_run=self._calculate_next_run(cron_expression, cron_iter),
+                cron_iter=cron_iter,
+                extra=kwargs
+            )
             
             self._scheduled_updates[schedule_id] = schedule_config
+            heapq.heappush(self._schedule_heap, (schedule_config.next_run, schedule_id))
             
             logger.info("Model update scheduled",
                        schedule_id=schedule_id,
                        model_name=model_name,
                        target_version=target_version,
-                       next_run=schedule_config["next_run"])
+                       next_run=schedule_config.next_run)
             
             return schedule_id
             
@@ -286,32 +444,27 @@ class ModelUpdateAutomation:
                       notes: List[str] = None) -> str:
         """Manually trigger a model update"""
         try:
-            update_id = f"{model_name}_{target_version}_{int(time.time())}"
-            
-            # Get current version
-            current_model = self.model_manager.get_active_model(model_name)
-            current_version = current_model.version if current_model else "none"
-            
-            # Create update
-            update = ModelUpdate(
-                update_id=update_id,
+            update = self._build_update(
                 model_name=model_name,
-                current_version=current_version,
                 target_version=target_version,
                 trigger=trigger,
                 deployment_strategy=deployment_strategy,
+                validation_rules=validation_rules,
                 new_configuration=new_configuration,
-                validation_rules=validation_rules or self._get_default_validation_rules(),
                 triggered_by=triggered_by,
-                notes=notes or []
+                notes=notes
             )
+            update_id = update.update_id
             
             self._pending_updates[update_id] = update
+            self._index_update(update)
+            self._pending_order.append(update_id)
+            self._work_available.set()
             
             logger.info("Model update triggered",
                        update_id=update_id,
                        model_name=model_name,
-                       current_version=current_version,
+                       current_version=update.current_version,
                        target_version=target_version,
                        trigger=trigger.value,
                        triggered_by=triggered_by)
@@ -325,16 +478,78 @@ class ModelUpdateAutomation:
                         error=str(e))
             raise
     
+    def _build_update(self,
+                     model_name: str,
+                     target_version: str,
+                     trigger: UpdateTrigger,
+                     deployment_strategy: DeploymentStrategy,
+                     validation_rules: List[ValidationRule] = None,
+                     new_configuration: ModelConfiguration = None,
+                     triggered_by: str = "user",
+                     notes: List[str] = None) -> ModelUpdate:
+        """Create a pending update against the current active version"""
+        # Random suffix: a timestamp collides when triggers land in the same second
+        update_id = f"{model_name}_{target_version}_{uuid.uuid4().hex[:12]}"
+        
+        # Get current version
+        current_model = self.model_manager.get_active_model(model_name)
+        current_version = current_model.version if current_model else "none"
+        
+        return ModelUpdate(
+            update_id=update_id,
+            model_name=model_name,
+            current_version=current_version,
+            target_version=target_version,
+            trigger=trigger,
+            deployment_strategy=deployment_strategy,
+            new_configuration=new_configuration,
+            validation_rules=validation_rules or self._get_default_validation_rules(),
+            triggered_by=triggered_by,
+            notes=notes or []
+        )
+    
+    def _index_update(self, update: ModelUpdate):
+        """Add an update to the lookup indices"""
+        self._update_by_id[update.update_id] = update
+        self._updates_by_model[update.model_name].add(update.update_id)
+        self._updates_by_status[update.status].add(update.update_id)
+    
+    def _unindex_update(self, update: ModelUpdate):
+        """Remove an update from the lookup indices"""
+        if self._update_by_id.get(update.update_id) is not update:
+            return
+        del self._update_by_id[update.update_id]
+        self._updates_by_model[update.model_name].discard(update.update_id)
+        self._updates_by_status[update.status].discard(update.update_id)
+    
+    def _set_update_status(self, update: ModelUpdate, status: UpdateStatus):
+        """Change an update's status, keeping the status index in sync"""
+        if self._update_by_id.get(update.update_id) is update:
+            self._updates_by_status[update.status].discard(update.update_id)
+            self._updates_by_status[status].add(update.update_id)
+        update.status = status
+    
+    def _append_completed(self, update: ModelUpdate):
+        """Record a finished update, dropping the oldest from the indices when full"""
+        completed_updates = self._completed_updates
+        if not completed_updates.maxlen:
+            # No history kept (max_completed_history 0): the update is not retained
+            self._unindex_update(update)
+            return
+        if len(completed_updates) == completed_updates.maxlen:
+            self._unindex_update(completed_updates[0])
+        completed_updates.append(update)
+    
     def cancel_update(self, update_id: str, reason: str = "User cancelled") -> bool:
         """Cancel a pending or active update"""
         try:
             if update_id in self._pending_updates:
                 update = self._pending_updates[update_id]
-                update.status = UpdateStatus.FAILED
+                self._set_update_status(update, UpdateStatus.FAILED)
                 update.rollback_reason = reason
-                update.completed_at = time.time()
+                update.mark_completed()
                 
-                self._completed_updates.append(update)
+                self._append_completed(update)
                 del self._pending_updates[update_id]
                 
                 logger.info("Pending update cancelled", update_id=update_id, reason=reason)
@@ -342,13 +557,13 @@ class ModelUpdateAutomation:
             
             elif update_id in self._active_updates:
                 update = self._active_updates[update_id]
-                update.status = UpdateStatus.FAILED
+                self._set_update_status(update, UpdateStatus.FAILED)
                 update.rollback_reason = reason
-                update.completed_at = time.time()
+                update.mark_completed()
                 
                 # TODO: Cancel active deployment/testing
                 
-                self._completed_updates.append(update)
+                self._append_completed(update)
                 del self._active_updates[update_id]
                 
                 logger.info("Active update cancelled", update_id=update_id, reason=reason)
@@ -362,85 +577,131 @@ class ModelUpdateAutomation:
     
     async def _scheduler_loop(self):
         """Background scheduler loop"""
+        backoff = 1.0
         while not self._shutdown_event.is_set():
             try:
                 await self._check_scheduled_updates()
+                backoff = 1.0
+                
+                # Sleep until the next schedule is due, but no longer than the check interval
+                timeout = self.update_check_interval_minutes * 60
+                if self._schedule_heap:
+                    timeout = min(timeout, max(0.0, self._schedule_heap[0][0] - time.time()))
                 
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
-                    timeout=self.update_check_interval_minutes * 60
+                    timeout=timeout
                 )
                 
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
-                logger.error("Scheduler loop error", error=str(e))
-                await asyncio.sleep(300)
+                logger.error("Scheduler loop error", error=str(e), retry_in_seconds=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 300)
     
     async def _check_scheduled_updates(self):
         """Check for scheduled updates that need to run"""
         try:
             current_time = time.time()
+            schedule_heap = self._schedule_heap
             
-            for schedule_id, schedule_config in self._scheduled_updates.items():
-                if (schedule_config["enabled"] and 
-                    schedule_config["next_run"] and
-                    current_time >= schedule_config["next_run"]):
-                    
-                    # Trigger the scheduled update
-                    update_id = self.trigger_update(
-                        model_name=schedule_config["model_name"],
-                        target_version=schedule_config["target_version"],
-                        trigger=UpdateTrigger.SCHEDULE,
-                        deployment_strategy=schedule_config["deployment_strategy"],
-                        validation_rules=schedule_config["validation_rules"],
-                        triggered_by=f"scheduler:{schedule_id}",
-                        notes=[f"Scheduled update: {schedule_config['cron_expression']}"]
-                    )
-                    
-                    # Update schedule
-                    schedule_config["last_run"] = current_time
-                    schedule_config["next_run"] = self._calculate_next_run(schedule_config["cron_expression"])
-                    
-                    logger.info("Scheduled update triggered",
-                               schedule_id=schedule_id,
-                               update_id=update_id,
-                               next_run=schedule_config["next_run"])
+            # Pop due schedules off the heap, skipping removed, disabled or superseded entries
+            due_schedules = []
+            while schedule_heap and schedule_heap[0][0] <= current_time:
+                next_run, schedule_id = heapq.heappop(schedule_heap)
+                schedule_config = self._scheduled_updates.get(schedule_id)
+                if (schedule_config is None or
+                        not schedule_config.enabled or
+                        schedule_config.next_run != next_run):
+                    continue
+                due_schedules.append((schedule_id, schedule_config))
+            
+            if not due_schedules:
+                return
+            
+            # Advance schedules
+            for schedule_id, schedule_config in due_schedules:
+                schedule_config.last_run = current_time
+                schedule_config.next_run = self._calculate_next_run(
+                    schedule_config.cron_expression, schedule_config.cron_iter, current_time
+                )
+                heapq.heappush(schedule_heap, (schedule_config.next_run, schedule_id))
+            
+            # Build all due updates, then queue them in one go
+            new_updates = [
+                self._build_update(
+                    model_name=schedule_config.model_name,
+                    target_version=schedule_config.target_version,
+                    trigger=UpdateTrigger.SCHEDULE,
+                    deployment_strategy=schedule_config.deployment_strategy,
+                    validation_rules=schedule_config.validation_rules,
+                    triggered_by=f"scheduler:{schedule_id}",
+                    notes=[f"Scheduled update: {schedule_config.cron_expression}"]
+                )
+                for schedule_id, schedule_config in due_schedules
+            ]
+            
+            self._pending_updates.update((update.update_id, update) for update in new_updates)
+            for update in new_updates:
+                self._index_update(update)
+            self._pending_order.extend(update.update_id for update in new_updates)
+            self._work_available.set()
+            
+            logger.info("Scheduled updates triggered",
+                       count=len(new_updates),
+                       update_ids=[update.update_id for update in new_updates])
         
         except Exception as e:
             logger.error("Error checking scheduled updates", error=str(e))
     
     async def _processor_loop(self):
         """Background update processor loop"""
+        backoff = 1.0
         while not self._shutdown_event.is_set():
             try:
+                # Wake on new work, or every 30 seconds to check active update timeouts
+                try:
+                    await asyncio.wait_for(self._work_available.wait(), timeout=30)
+                except asyncio.TimeoutError:
+                    pass
+                self._work_available.clear()
+                
                 await self._process_pending_updates()
                 await self._monitor_active_updates()
                 
-                await asyncio.sleep(30)  # Check every 30 seconds
+                # Keep draining while updates are queued and a slot is free
+                if self._pending_updates and len(self._active_updates) < self.max_concurrent_updates:
+                    self._work_available.set()
+                
+                backoff = 1.0
                 
             except Exception as e:
-                logger.error("Processor loop error", error=str(e))
-                await asyncio.sleep(60)
+                logger.error("Processor loop error", error=str(e), retry_in_seconds=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
     
     async def _process_pending_updates(self):
         """Process pending updates"""
         try:
-            # Limit concurrent updates
-            if len(self._active_updates) >= self.max_concurrent_updates:
-                return
-            
-            # Get next pending update
-            pending_ids = list(self._pending_updates.keys())
-            if not pending_ids:
-                return
-            
-            update_id = pending_ids[0]  # FIFO processing
-            update = self._pending_updates[update_id]
-            
-            # Move to active updates
-            del self._pending_updates[update_id]
-            self._active_updates[update_id] = update
+            async with self._state_lock:
+                # Limit concurrent updates
+                if len(self._active_updates) >= self.max_concurrent_updates:
+                    return
+                
+                # Drop IDs of updates cancelled while pending
+                pending_order = self._pending_order
+                while pending_order and pending_order[0] not in self._pending_updates:
+                    pending_order.popleft()
+                
+                # Get next pending update
+                if not pending_order:
+                    return
+                
+                # Move to active updates (FIFO processing)
+                update_id = pending_order.popleft()
+                update = self._pending_updates.pop(update_id)
+                self._active_updates[update_id] = update
             
             # Start processing
             await self._execute_update(update)
@@ -451,8 +712,10 @@ class ModelUpdateAutomation:
     async def _execute_update(self, update: ModelUpdate):
         """Execute a model update"""
         try:
-            update.status = UpdateStatus.VALIDATING
-            update.started_at = time.time()
+            self._set_update_status(update, UpdateStatus.VALIDATING)
+            update.mark_started()
+            heapq.heappush(self._timeout_heap,
+                           (update.started_monotonic + _UPDATE_TIMEOUT_SECONDS, update.update_id))
             
             logger.info("Starting model update execution",
                        update_id=update.update_id,
@@ -461,33 +724,33 @@ class ModelUpdateAutomation:
             
             # Phase 1: Validation
             if not await self._run_validation(update):
-                update.status = UpdateStatus.FAILED
-                update.completed_at = time.time()
+                self._set_update_status(update, UpdateStatus.FAILED)
+                update.mark_completed()
                 await self._complete_update(update)
                 return
             
             # Phase 2: Deployment
-            update.status = UpdateStatus.DEPLOYING
+            self._set_update_status(update, UpdateStatus.DEPLOYING)
             
             if not await self._deploy_model(update):
-                update.status = UpdateStatus.FAILED
-                update.completed_at = time.time()
+                self._set_update_status(update, UpdateStatus.FAILED)
+                update.mark_completed()
                 await self._complete_update(update)
                 return
             
             # Phase 3: Testing (if applicable)
-            if update.deployment_strategy in [DeploymentStrategy.CANARY, DeploymentStrategy.A_B_TEST]:
-                update.status = UpdateStatus.TESTING
+            if update.deployment_strategy in _TESTING_STRATEGIES:
+                self._set_update_status(update, UpdateStatus.TESTING)
                 
                 if not await self._run_testing(update):
-                    update.status = UpdateStatus.ROLLED_BACK
-                    update.completed_at = time.time()
+                    self._set_update_status(update, UpdateStatus.ROLLED_BACK)
+                    update.mark_completed()
                     await self._complete_update(update)
                     return
             
             # Phase 4: Completion
-            update.status = UpdateStatus.COMPLETED
-            update.completed_at = time.time()
+            self._set_update_status(update, UpdateStatus.COMPLETED)
+            update.mark_completed()
             await self._complete_update(update)
             
             logger.info("Model update completed successfully",
@@ -499,94 +762,122 @@ class ModelUpdateAutomation:
                         update_id=update.update_id,
                         error=str(e))
             
-            update.status = UpdateStatus.FAILED
+            self._set_update_status(update, UpdateStatus.FAILED)
             update.rollback_reason = f"Execution error: {str(e)}"
-            update.completed_at = time.time()
+            update.mark_completed()
             await self._complete_update(update)
     
     async def _run_validation(self, update: ModelUpdate) -> bool:
         """Run validation rules for update"""
+        log = logger.bind(update_id=update.update_id)
         try:
-            logger.info("Running validation rules",
-                       update_id=update.update_id,
-                       rule_count=len(update.validation_rules))
-            
-            all_passed = True
+            log.info("Running validation rules",
+                    rule_count=len(update.validation_rules))
             
-            for rule in update.validation_rules:
-                start_time = time.time()
-                
-                try:
-                    # Get validator function
-                    if rule.validator_function not in self._validators:
-                        result = ValidationResult(
-                            rule_name=rule.name,
-                            passed=False,
-                            message=f"Validator function '{rule.validator_function}' not found",
-                            execution_time_seconds=0.0
-                        )
+            if self.validation_fail_fast:
+                # Blocking rules (required, error-level) run together first; the
+                # remaining rules only run if every blocking rule passed
+                blocking_rules = []
+                advisory_rules = []
+                for rule in update.validation_rules:
+                    if rule.required and rule.severity == "error":
+                        blocking_rules.append(rule)
                     else:
-                        validator_func = self._validators[rule.validator_function]
-                        
-                        # Run validator with timeout
-                        try:
-                            passed, message, details = await asyncio.wait_for(
-                                validator_func(update),
-                                timeout=rule.timeout_seconds
-                            )
-                            
-                            result = ValidationResult(
-                                rule_name=rule.name,
-                                passed=passed,
-                                message=message,
-                                execution_time_seconds=time.time() - start_time,
-                                details=details or {}
-                            )
-                        
-                        except asyncio.TimeoutError:
-                            result = ValidationResult(
-                                rule_name=rule.name,
-                                passed=False,
-                                message=f"Validation timed out after {rule.timeout_seconds} seconds",
-                                execution_time_seconds=rule.timeout_seconds
-                            )
-                    
-                    update.validation_results.append(result)
-                    
-                    # Check if this failure should stop the update
+                        advisory_rules.append(rule)
+                
+                results = await asyncio.gather(
+                    *(self._run_validation_rule(update, rule, log) for rule in blocking_rules)
+                )
+                update.validation_results.extend(results)
+                all_passed = all(result.passed for result in results)
+                
+                if all_passed and advisory_rules:
+                    advisory_results = await asyncio.gather(
+                        *(self._run_validation_rule(update, rule, log) for rule in advisory_rules)
+                    )
+                    update.validation_results.extend(advisory_results)
+                    results += advisory_results
+                
+                passed_count = sum(result.passed for result in results)
+            else:
+                # Rules are independent, so run them concurrently
+                results = await asyncio.gather(
+                    *(self._run_validation_rule(update, rule, log) for rule in update.validation_rules)
+                )
+                update.validation_results.extend(results)
+                
+                # Only failures of required error-level rules stop the update
+                all_passed = True
+                passed_count = 0
+                for result, rule in zip(results, update.validation_rules):
+                    passed_count += result.passed
                     if not result.passed and rule.required and rule.severity == "error":
                         all_passed = False
+            
+            log.info("Validation completed",
+                    passed=all_passed,
+                    total_rules=len(update.validation_rules),
+                    passed_rules=passed_count)
+            
+            return all_passed
+        
+        except Exception as e:
+            log.error("Error running validation", error=str(e))
+            return False
+    
+    async def _run_validation_rule(self, update: ModelUpdate, rule: ValidationRule, log: Any = logger) -> ValidationResult:
+        """Run a single validation rule, converting failures into a result"""
+        start_time = time.monotonic()
+        
+        try:
+            # Get validator function
+            if rule.validator_function not in self._validators:
+                result = ValidationResult(
+                    rule_name=rule.name,
+                    passed=False,
+                    message=f"Validator function '{rule.validator_function}' not found",
+                    execution_time_seconds=0.0
+                )
+            else:
+                validator_func = self._validators[rule.validator_function]
+                
+                # Run validator with timeout
+                try:
+                    passed, message, details = await asyncio.wait_for(
+                        validator_func(update),
+                        timeout=rule.timeout_seconds
+                    )
                     
-                    logger.debug("Validation rule completed",
-                               rule_name=rule.name,
-                               passed=result.passed,
-                               execution_time=result.execution_time_seconds)
+                    result = ValidationResult(
+                        rule_name=rule.name,
+                        passed=passed,
+                        message=message,
+                        execution_time_seconds=time.monotonic() - start_time,
+                        details=details or {}
+                    )
                 
-                except Exception as e:
+                except asyncio.TimeoutError:
                     result = ValidationResult(
                         rule_name=rule.name,
                         passed=False,
-                        message=f"Validation error: {str(e)}",
-                        execution_time_seconds=time.time() - start_time
+                        message=f"Validation timed out after {rule.timeout_seconds} seconds",
+                        execution_time_seconds=rule.timeout_seconds
                     )
-                    update.validation_results.append(result)
-                    
-                    if rule.required and rule.severity == "error":
-                        all_passed = False
             
-            logger.info("Validation completed",
-                       update_id=update.update_id,
-                       passed=all_passed,
-                       total_rules=len(update.validation_rules),
-                       passed_rules=sum(1 for r in update.validation_results if r.passed))
+            log.debug("Validation rule completed",
+                     rule_name=rule.name,
+                     passed=result.passed,
+                     execution_time=result.execution_time_seconds)
             
-            return all_passed
+            return result
         
         except Exception as e:
-            logger.error("Error running validation",
-                        update_id=update.update_id,
-                        error=str(e))
-            return False
+            return ValidationResult(
+                rule_name=rule.name,
+                passed=False,
+                message=f"Validation error: {str(e)}",
+                execution_time_seconds=time.monotonic() - start_time
+            )
     
     async def _deploy_model(self, update: ModelUpdate) -> bool:
         """Deploy the model version"""
@@ -675,15 +966,17 @@ class ModelUpdateAutomation:
     async def _complete_update(self, update: ModelUpdate):
         """Complete an update and move to completed list"""
         try:
-            # Move from active to completed
-            if update.update_id in self._active_updates:
-                del self._active_updates[update.update_id]
-            
-            self._completed_updates.append(update)
+            async with self._state_lock:
+                # Move from active to completed; an update cancelled while running
+                # was already moved by cancel_update
+                if self._active_updates.pop(update.update_id, None) is None:
+                    return
+                
+                self._append_completed(update)
             
-            # Limit completed updates list size
-            if len(self._completed_updates) > 1000:
-                self._completed_updates = self._completed_updates[-1000:]
+            # A concurrency slot freed up
+            if self._pending_updates:
+                self._work_available.set()
             
             logger.info("Model update completed",
                        update_id=update.update_id,
@@ -698,28 +991,37 @@ class ModelUpdateAutomation:
     async def _monitor_active_updates(self):
         """Monitor active updates for timeouts and issues"""
         try:
-            current_time = time.time()
-            timeout_threshold = 3600  # 1 hour timeout
+            current_time = time.monotonic()
+            timeout_heap = self._timeout_heap
             
-            for update_id, update in list(self._active_updates.items()):
-                if update.started_at and (current_time - update.started_at) > timeout_threshold:
-                    logger.warning("Update timed out",
-                                 update_id=update_id,
-                                 duration_minutes=update.duration_minutes)
-                    
-                    update.status = UpdateStatus.FAILED
-                    update.rollback_reason = "Update timed out"
-                    update.completed_at = current_time
-                    await self._complete_update(update)
+            # Only deadlines at the head of the heap can have expired
+            while timeout_heap and timeout_heap[0][0] <= current_time:
+                deadline, update_id = heapq.heappop(timeout_heap)
+                update = self._active_updates.get(update_id)
+                if (update is None or
+                        update.started_monotonic is None or
+                        update.started_monotonic + _UPDATE_TIMEOUT_SECONDS != deadline):
+                    continue
+                
+                logger.warning("Update timed out",
+                             update_id=update_id,
+                             duration_minutes=update.duration_minutes)
+                
+                self._set_update_status(update, UpdateStatus.FAILED)
+                update.rollback_reason = "Update timed out"
+                update.mark_completed()
+                await self._complete_update(update)
         
         except Exception as e:
             logger.error("Error monitoring active updates", error=str(e))
     
     async def _monitor_loop(self):
         """Background monitoring loop"""
+        backoff = 1.0
         while not self._shutdown_event.is_set():
             try:
                 await self._monitor_performance_triggers()
+                backoff = 1.0
                 
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
@@ -729,8 +1031,9 @@ class ModelUpdateAutomation:
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
-                logger.error("Monitor loop error", error=str(e))
-                await asyncio.sleep(300)
+                logger.error("Monitor loop error", error=str(e), retry_in_seconds=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 300)
     
     async def _monitor_performance_triggers(self):
         """Monitor for performance-based update triggers"""
@@ -741,59 +1044,47 @@ class ModelUpdateAutomation:
     def _register_default_validators(self):
         """Register default validation functions"""
         
+        # Validators let unexpected errors propagate; _run_validation_rule turns
+        # them into a failed ValidationResult
         async def validate_model_configuration(update: ModelUpdate) -> tuple[bool, str, dict]:
             """Validate model configuration"""
-            try:
-                if not update.new_configuration:
-                    return True, "No new configuration to validate", {}
-                
-                config = update.new_configuration
-                
-                # Basic validation checks
-                if not config.provider:
-                    return False, "Provider not specified", {}
-                
-                if not config.model_name:
-                    return False, "Model name not specified", {}
-                
-                if config.temperature < 0 or config.temperature > 2:
-                    return False, f"Invalid temperature: {config.temperature}", {}
-                
-                if config.max_tokens <= 0:
-                    return False, f"Invalid max_tokens: {config.max_tokens}", {}
-                
-                return True, "Configuration validation passed", {
-                    "provider": config.provider,
-                    "model_name": config.model_name,
-                    "temperature": config.temperature,
-                    "max_tokens": config.max_tokens
-                }
-                
-            except Exception as e:
-                return False, f"Configuration validation error: {str(e)}", {}
+            config = update.new_configuration
+            if config is None:
+                return True, "No new configuration to validate", {}
+            
+            # Same checked fields give the same outcome; reuse it
+            cache_key = (config.provider, config.model_name, config.temperature, config.max_tokens)
+            cached = self._validation_cache.get(cache_key)
+            if cached is not None:
+                self._validation_cache.move_to_end(cache_key)
+                return cached
+            
+            result = _check_model_configuration(config)
+            
+            self._validation_cache[cache_key] = result
+            if len(self._validation_cache) > self._validation_cache_size:
+                self._validation_cache.popitem(last=False)
+            
+            return result
         
         async def validate_model_availability(update: ModelUpdate) -> tuple[bool, str, dict]:
             """Validate that the target model version is available"""
-            try:
-                # Check if model version exists or can be created
-                model_version = self.model_manager.get_model_version(
-                    update.model_name, update.target_version
-                )
-                
-                if model_version:
-                    return True, "Model version is available", {
-                        "model_id": model_version.model_id,
-                        "status": model_version.status.value
-                    }
-                elif update.new_configuration:
-                    return True, "Model version will be created", {
-                        "configuration_provided": True
-                    }
-                else:
-                    return False, "Model version not found and no configuration provided", {}
-                
-            except Exception as e:
-                return False, f"Model availability check error: {str(e)}", {}
+            # Check if model version exists or can be created
+            model_version = self.model_manager.get_model_version(
+                update.model_name, update.target_version
+            )
+            
+            if model_version:
+                return True, "Model version is available", {
+                    "model_id": model_version.model_id,
+                    "status": STATUS_VALUES[model_version.status]
+                }
+            elif update.new_configuration:
+                return True, "Model version will be created", {
+                    "configuration_provided": True
+                }
+            else:
+                return False, "Model version not found and no configuration provided", {}
         
         # Register validators
         self._validators["validate_model_configuration"] = validate_model_configuration
@@ -801,96 +1092,82 @@ class ModelUpdateAutomation:
     
     def _get_default_validation_rules(self) -> List[ValidationRule]:
         """Get default validation rules"""
-        return [
-            ValidationRule(
-                name="Model Configuration Validation",
-                description="Validate model configuration parameters",
-                validator_function="validate_model_configuration",
-                severity="error",
-                required=True
-            ),
-            ValidationRule(
-                name="Model Availability Check",
-                description="Check if target model version is available",
-                validator_function="validate_model_availability",
-                severity="error",
-                required=True
-            )
-        ]
-    
-    def _calculate_next_run(self, cron_expression: str) -> float:
-        """Calculate next run time from cron expression (simplified)"""
-        # This is a simplified implementation
-        # In production, use a proper cron parser like croniter
-        
-        # For now, just add 24 hours for daily schedules
-        if "0 0 * * *" in cron_expression:  # Daily at midnight
-            return time.time() + 86400  # 24 hours
-        elif "0 */6 * * *" in cron_expression:  # Every 6 hours
-            return time.time() + 21600  # 6 hours
-        else:
-            return time.time() + 86400  # Default to 24 hours
+        return list(_default_validation_rules())
     
-    def get_update_status(self, update_id: str) -> Optional[Dict[str, Any]]:
-        """Get status of a specific update"""
-        # Check active updates
-        if update_id in self._active_updates:
-            return self._active_updates[update_id].to_dict()
-        
-        # Check pending updates
-        if update_id in self._pending_updates:
-            return self._pending_updates[update_id].to_dict()
-        
-        # Check completed updates
-        for update in self._completed_updates:
-            if update.update_id == update_id:
-                return update.to_dict()
-        
-        return None
-    
-    def list_updates(self, model_name: str = None, status: UpdateStatus = None) -> List[Dict[str, Any]]:
-        """List updates with optional filtering"""
-        all_updates = (
-            list(self._pending_updates.values()) +
-            list(self._active_updates.values()) +
-            self._completed_updates
-        )
+    def _calculate_next_run(self,
+                            cron_expression: str,
+                            cron_iter: Any = None,
+                            current_time: Optional[float] = None) -> float:
+        """Calculate next run time from cron expression"""
+        if current_time is None:
+            current_time = time.time()
         
-        # Apply filters
-        filtered_updates = all_updates
+        if cron_iter is not None:
+            # Restart from now rather than the previous slot, so runs missed
+            # while the scheduler was late or suspended are skipped, not replayed
+            cron_iter.set_current(current_time)
+            return cron_iter.get_next(float)
         
-        if model_name:
-            filtered_updates = [u for u in filtered_updates if u.model_name == model_name]
+        # Simplified fallback when croniter is not installed; unknown expressions run daily
+        return current_time + _CRON_FALLBACK_INTERVALS.get(cron_expression.strip(), 86400)
+    
+    def get_update_status(self, update_id: str) -> Optional[Dict[str, Any]]:
+        """Get status of a specific update"""
+        update = self._update_by_id.get(update_id)
+        return update.to_dict() if update else None
+    
+    def list_updates(self, model_name: str = None, status: UpdateStatus = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List updates with optional filtering, newest first, up to limit if given"""
+        # Narrow candidates through the indices
+        if model_name and status:
+            update_ids = (self._updates_by_model.get(model_name, set()) &
+                          self._updates_by_status.get(status, set()))
+        elif model_name:
+            update_ids = self._updates_by_model.get(model_name, set())
+        elif status:
+            update_ids = self._updates_by_status.get(status, set())
+        else:
+            update_ids = self._update_by_id.keys()
         
-        if status:
-            filtered_updates = [u for u in filtered_updates if u.status == status]
+        filtered_updates = (self._update_by_id[update_id] for update_id in update_ids)
         
-        # Sort by creation time (newest first)
-        filtered_updates.sort(key=lambda u: u.created_at, reverse=True)
+        # Sort by creation time (newest first); a partial heap selection when limited
+        if limit is not None:
+            filtered_updates = heapq.nlargest(limit, filtered_updates, key=_CREATED_AT)
+        else:
+            filtered_updates = sorted(filtered_updates, key=_CREATED_AT, reverse=True)
         
         return [u.to_dict() for u in filtered_updates]
     
+    def snapshot_completed(self) -> List[Dict[str, Any]]:
+        """Serialize all retained completed updates, oldest first"""
+        return [update.to_dict() for update in self._completed_updates]
+    
     def get_automation_statistics(self) -> Dict[str, Any]:
         """Get comprehensive automation statistics"""
-        try:
-            return {
-                "pending_updates": len(self._pending_updates),
-                "active_updates": len(self._active_updates),
-                "completed_updates": len(self._completed_updates),
-                "scheduled_updates": len(self._scheduled_updates),
-                "registered_validators": len(self._validators),
-                "max_concurrent_updates": self.max_concurrent_updates,
-                "update_check_interval_minutes": self.update_check_interval_minutes,
-                "status_breakdown": {
-                    status.value: len([u for u in self._completed_updates if u.status == status])
-                    for status in UpdateStatus
-                },
-                "trigger_breakdown": {
-                    trigger.value: len([u for u in self._completed_updates if u.trigger == trigger])
-                    for trigger in UpdateTrigger
-                }
-            }
+        # One pass over the (bounded) completed updates, then fold the few pairs
+        status_counts = Counter()
+        trigger_counts = Counter()
+        for (status, trigger), count in Counter((u.status, u.trigger) for u in self._completed_updates).items():
+            status_counts[status] += count
+            trigger_counts[trigger] += count
         
-        except Exception as e:
-            logger.error("Error getting automation statistics", error=str(e))
-            return {"error": str(e)}
\ No newline at end of file
+        return {
+            "pending_updates": len(self._pending_updates),
+            "active_updates": len(self._active_updates),
+            "completed_updates": len(self._completed_updates),
+            "scheduled_updates": len(self._scheduled_updates),
+            "registered_validators": len(self._validators),
+            "max_concurrent_updates": self.max_concurrent_updates,
+            "max_completed_history": self.max_completed_history,
+            "update_check_interval_minutes": self.update_check_interval_minutes,
+            "status_breakdown": {
+                value: status_counts[status]
+                for status, value in UPDATE_STATUS_VALUES.items()
+            },
+            "trigger_breakdown": {
+                value: trigger_counts[trigger]
+                for trigger, value in TRIGGER_VALUES.items()
+            }
+        }
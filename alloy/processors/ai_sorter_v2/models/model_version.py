@@ -5,16 +5,31 @@ Comprehensive model versioning system for tracking, deploying, and managing
 AI models across different providers with A/B testing and rollback capabilities.
 """
 
+import json
+import sys
 import time
 import uuid
+from collections import Counter, deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import structlog
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
+# Upper bounds for per-version history so saved payloads stay flat over time
+MAX_CHANGELOG_ENTRIES = 200
+MAX_CHILD_VERSIONS = 200
+
+# Smoothing factor for the running response time and confidence averages
+EMA_ALPHA = 0.1
+
 
 class ModelStatus(Enum):
     """Model deployment status"""
@@ -34,7 +49,115 @@ class DeploymentStrategy(Enum):
     A_B_TEST = "a_b_test"  # Side-by-side testing
 
 
-@dataclass
+class P2Quantile:
+    """Streaming quantile estimate (P-square algorithm) in constant memory"""
+    __slots__ = ("quantile", "_heights", "_positions", "_desired", "_increments")
+    
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4.0]
+        self._increments = (0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0)
+    
+    def add(self, value: float) -> None:
+        """Add an observation"""
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            if len(heights) == 5:
+                heights.sort()
+            return
+        
+        # Find the cell the observation falls in, extending the extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+        
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        desired = self._desired
+        increments = self._increments
+        for i in range(5):
+            desired[i] += increments[i]
+        
+        # Nudge the three inner markers toward their desired positions
+        for i in (1, 2, 3):
+            offset = desired[i] - positions[i]
+            if ((offset >= 1 and positions[i + 1] - positions[i] > 1) or
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1)):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] += step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                positions[i] += step
+    
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction for marker i"""
+        heights = self._heights
+        positions = self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+    
+    def value(self) -> float:
+        """Current quantile estimate (exact until five observations are seen)"""
+        heights = self._heights
+        if len(heights) < 5:
+            if not heights:
+                return 0.0
+            ordered = sorted(heights)
+            return ordered[int(round(self.quantile * (len(ordered) - 1)))]
+        return heights[2]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the marker state to a dictionary"""
+        return {
+            "heights": list(self._heights),
+            "positions": list(self._positions),
+            "desired": list(self._desired)
+        }
+    
+    @classmethod
+    def from_dict(cls, quantile: float, data: Dict[str, Any]) -> 'P2Quantile':
+        """Restore an estimator from its marker state"""
+        estimator = cls(quantile)
+        estimator._heights = list(data["heights"])
+        estimator._positions = list(data["positions"])
+        estimator._desired = list(data["desired"])
+        return estimator
+
+
+def dumps_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+# Enum member -> value maps; a dict get is cheaper than the .value descriptor
+STATUS_VALUES = {status: status.value for status in ModelStatus}
+STRATEGY_VALUES = {strategy: strategy.value for strategy in DeploymentStrategy}
+
+# Value -> enum member maps for deserialization
+STATUS_BY_VALUE = {status.value: status for status in ModelStatus}
+STRATEGY_BY_VALUE = {strategy.value: strategy for strategy in DeploymentStrategy}
+
+
+@dataclass(slots=True)
 class ModelMetrics:
     """Model performance metrics"""
     # Request metrics
@@ -66,6 +189,17 @@ class ModelMetrics:
     last_request_time: Optional[float] = None
     last_updated: float = field(default_factory=time.time)
     
+    # Derived from the request counts, kept current by update_request_metrics
+    success_rate: float = field(init=False, default=0.0)
+    
+    # Streaming tail latency estimators; marker state round-trips through to_dict
+    _p95_estimator: Optional[P2Quantile] = field(init=False, repr=False, compare=False, default=None)
+    _p99_estimator: Optional[P2Quantile] = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        if self.total_requests > 0:
+            self.success_rate = self.successful_requests / self.total_requests
+    
     def update_request_metrics(self, response_time: float, success: bool, confidence: float = 0.0, cost: float = 0.0):
         """Update metrics with new request data"""
         current_time = time.time()
@@ -77,40 +211,50 @@ class ModelMetrics:
         self.last_updated = current_time
         
         # Update request counts
-        self.total_requests += 1
+        total_requests = self.total_requests + 1
+        self.total_requests = total_requests
         if success:
             self.successful_requests += 1
         else:
             self.failed_requests += 1
+        self.success_rate = self.successful_requests / total_requests
         
         # Update response time metrics
         if response_time > 0:
-            if self.total_requests == 1:
+            if total_requests == 1:
                 self.avg_response_time = response_time
                 self.min_response_time = response_time
                 self.max_response_time = response_time
             else:
                 # Exponential moving average for response time
-                alpha = 0.1
-                self.avg_response_time = alpha * response_time + (1 - alpha) * self.avg_response_time
-                self.min_response_time = min(self.min_response_time, response_time)
-                self.max_response_time = max(self.max_response_time, response_time)
+                self.avg_response_time += EMA_ALPHA * (response_time - self.avg_response_time)
+                if response_time < self.min_response_time:
+                    self.min_response_time = response_time
+                if response_time > self.max_response_time:
+                    self.max_response_time = response_time
+            
+            # Tail latency
+            if self._p95_estimator is None:
+                self._p95_estimator = P2Quantile(0.95)
+                self._p99_estimator = P2Quantile(0.99)
+            self._p95_estimator.add(response_time)
+            self._p99_estimator.add(response_time)
+            self.p95_response_time = self._p95_estimator.value()
+            self.p99_response_time = self._p99_estimator.value()
         
         # Update confidence score
         if confidence > 0:
-            if self.total_requests == 1:
+            if total_requests == 1:
                 self.avg_confidence_score = confidence
             else:
-                alpha = 0.1
-                self.avg_confidence_score = alpha * confidence + (1 - alpha) * self.avg_confidence_score
+                self.avg_confidence_score += EMA_ALPHA * (confidence - self.avg_confidence_score)
         
         # Update cost metrics
         self.total_cost += cost
-        if self.total_requests > 0:
-            self.cost_per_request = self.total_cost / self.total_requests
+        self.cost_per_request = self.total_cost / total_requests
         
         # Update derived metrics
-        self.error_rate = self.failed_requests / self.total_requests if self.total_requests > 0 else 0.0
+        self.error_rate = self.failed_requests / total_requests
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary"""
@@ -118,11 +262,15 @@ class ModelMetrics:
             "total_requests": self.total_requests,
             "successful_requests": self.successful_requests,
             "failed_requests": self.failed_requests,
-            "success_rate": self.successful_requests / self.total_requests if self.total_requests > 0 else 0.0,
+            "success_rate": self.success_rate,
             "error_rate": self.error_rate,
             "avg_response_time": self.avg_response_time,
             "min_response_time": self.min_response_time if self.min_response_time != float('inf') else 0.0,
             "max_response_time": self.max_response_time,
+            "p95_response_time": self.p95_response_time,
+            "p99_response_time": self.p99_response_time,
+            "p95_estimator": self._p95_estimator.to_dict() if self._p95_estimator else None,
+            "p99_estimator": self._p99_estimator.to_dict() if self._p99_estimator else None,
             "avg_confidence_score": self.avg_confidence_score,
             "cost_per_request": self.cost_per_request,
             "total_cost": self.total_cost,
@@ -130,9 +278,35 @@ class ModelMetrics:
             "last_request_time": self.last_request_time,
             "last_updated": self.last_updated
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelMetrics':
+        """Create metrics from dictionary"""
+        metrics = cls(
+            total_requests=data.get("total_requests", 0),
+            successful_requests=data.get("successful_requests", 0),
+            failed_requests=data.get("failed_requests", 0),
+            avg_response_time=data.get("avg_response_time", 0.0),
+            min_response_time=data.get("min_response_time", float('inf')),
+            max_response_time=data.get("max_response_time", 0.0),
+            p95_response_time=data.get("p95_response_time", 0.0),
+            p99_response_time=data.get("p99_response_time", 0.0),
+            avg_confidence_score=data.get("avg_confidence_score", 0.0),
+            cost_per_request=data.get("cost_per_request", 0.0),
+            total_cost=data.get("total_cost", 0.0),
+            error_rate=data.get("error_rate", 0.0),
+            first_request_time=data.get("first_request_time"),
+            last_request_time=data.get("last_request_time"),
+            last_updated=data["last_updated"] if "last_updated" in data else time.time()
+        )
+        if data.get("p95_estimator"):
+            metrics._p95_estimator = P2Quantile.from_dict(0.95, data["p95_estimator"])
+        if data.get("p99_estimator"):
+            metrics._p99_estimator = P2Quantile.from_dict(0.99, data["p99_estimator"])
+        return metrics
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfiguration:
     """Model configuration parameters"""
     provider: str
@@ -155,6 +329,12 @@ class ModelConfiguration:
     enable_streaming: bool = False
     enable_batch_processing: bool = True
     
+    def __post_init__(self):
+        # Provider and model names repeat across many versions; share one string each
+        self.provider = sys.intern(self.provider)
+        self.model_name = sys.intern(self.model_name)
+        self.model_version = sys.intern(self.model_version)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
         return {
@@ -193,7 +373,7 @@ class ModelConfiguration:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelDeployment:
     """Model deployment information"""
     deployment_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -223,6 +403,7 @@ class ModelDeployment:
     auto_rollback_enabled: bool = True
     rollback_threshold_error_rate: float = 0.1
     rollback_threshold_response_time: float = 10.0
+    rollback_threshold_p99_response_time: Optional[float] = None  # None disables the tail latency check
     rollback_evaluation_window_minutes: int = 15
     
     # A/B testing configuration
@@ -230,14 +411,17 @@ class ModelDeployment:
     ab_test_min_requests: int = 1000
     ab_test_confidence_level: float = 0.95
     
+    def __post_init__(self):
+        self.deployed_by = sys.intern(self.deployed_by)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert deployment to dictionary"""
         return {
             "deployment_id": self.deployment_id,
             "model_id": self.model_id,
             "version": self.version,
-            "status": self.status.value,
-            "deployment_strategy": self.deployment_strategy.value,
+            "status": STATUS_VALUES[self.status],
+            "deployment_strategy": STRATEGY_VALUES[self.deployment_strategy],
             "traffic_percentage": self.traffic_percentage,
             "target_traffic_percentage": self.target_traffic_percentage,
             "rollout_step_percentage": self.rollout_step_percentage,
@@ -252,14 +436,23 @@ class ModelDeployment:
             "auto_rollback_enabled": self.auto_rollback_enabled,
             "rollback_threshold_error_rate": self.rollback_threshold_error_rate,
             "rollback_threshold_response_time": self.rollback_threshold_response_time,
+            "rollback_threshold_p99_response_time": self.rollback_threshold_p99_response_time,
             "rollback_evaluation_window_minutes": self.rollback_evaluation_window_minutes,
             "ab_test_duration_hours": self.ab_test_duration_hours,
             "ab_test_min_requests": self.ab_test_min_requests,
             "ab_test_confidence_level": self.ab_test_confidence_level
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelDeployment':
+        """Create deployment from dictionary"""
+        fields = dict(data)
+        fields["status"] = STATUS_BY_VALUE[data["status"]]
+        fields["deployment_strategy"] = STRATEGY_BY_VALUE[data["deployment_strategy"]]
+        return cls(**fields)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelVersion:
     """Comprehensive model version information"""
     # Core identification
@@ -287,23 +480,47 @@ class ModelVersion:
     validation_results: Dict[str, Any] = field(default_factory=dict)
     test_results: Dict[str, Any] = field(default_factory=dict)
     
-    # Changelog and notes
-    changelog: List[str] = field(default_factory=list)
+    # Changelog and notes (bounded, oldest entries are dropped)
+    changelog: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_CHANGELOG_ENTRIES))
     tags: List[str] = field(default_factory=list)
     
     # Dependencies
     parent_version: Optional[str] = None
-    child_versions: List[str] = field(default_factory=list)
+    child_versions: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_CHILD_VERSIONS))
+    
+    # Storage file name without extension ("<registry name>_<version>"), fixed at construction
+    storage_stem: str = field(init=False, repr=False, compare=False, default="")
+    
+    # Bumped by update_metrics; keys the rollback evaluation cache
+    _mutation_seq: int = field(init=False, repr=False, compare=False, default=0)
+    
+    # Health score memo: (metrics object, total_requests, last_updated, score)
+    _health_cache: Optional[Tuple[ModelMetrics, int, float, float]] = field(init=False, repr=False, compare=False, default=None)
+    
+    # Deployment counts per strategy value, kept in step with deployments
+    _strategy_counter: Counter = field(init=False, repr=False, compare=False, default_factory=Counter)
+    
+    # Most recently activated deployment still ACTIVE; kept current by set_deployment_status
+    _active_deployment: Optional[ModelDeployment] = field(init=False, repr=False, compare=False, default=None)
+    
+    # Last rollback evaluation: (deployment, mutation seq, monotonic ns, result)
+    _rollback_cache: Optional[Tuple[Optional[ModelDeployment], int, int, Tuple[bool, str]]] = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+        self.storage_stem = f"{self.name}_{self.version}"
     
     def add_deployment(self, deployment: ModelDeployment) -> None:
         """Add a new deployment"""
         deployment.model_id = self.model_id
         deployment.version = self.version
         self.deployments.append(deployment)
+        self._strategy_counter[STRATEGY_VALUES[deployment.deployment_strategy]] += 1
         
         # Update current deployment if this is active
         if deployment.status == ModelStatus.ACTIVE:
             self.current_deployment = deployment
+            self._active_deployment = deployment
             self.status = ModelStatus.ACTIVE
         
         logger.info("Deployment added to model version",
@@ -314,22 +531,42 @@ class ModelVersion:
     
     def get_active_deployment(self) -> Optional[ModelDeployment]:
         """Get the currently active deployment"""
-        for deployment in self.deployments:
-            if deployment.status == ModelStatus.ACTIVE:
-                return deployment
-        return None
+        return self._active_deployment
+    
+    def set_deployment_status(self, deployment: ModelDeployment, status: ModelStatus) -> None:
+        """Change a deployment's status, keeping the active deployment reference current"""
+        deployment.status = status
+        if status == ModelStatus.ACTIVE:
+            self._active_deployment = deployment
+        elif deployment is self._active_deployment:
+            self._active_deployment = None
     
     def update_metrics(self, response_time: float, success: bool, confidence: float = 0.0, cost: float = 0.0):
         """Update model metrics"""
         self.metrics.update_request_metrics(response_time, success, confidence, cost)
+        self._mutation_seq += 1
     
     def calculate_health_score(self) -> float:
         """Calculate overall health score (0.0 to 1.0)"""
+        # Keyed on the metrics themselves, so updates made directly on
+        # self.metrics or a replaced metrics object are picked up too
+        metrics = self.metrics
+        health_cache = self._health_cache
+        if (health_cache is not None and health_cache[0] is metrics and
+                health_cache[1] == metrics.total_requests and health_cache[2] == metrics.last_updated):
+            return health_cache[3]
+        
+        health_score = self._compute_health_score()
+        self._health_cache = (metrics, metrics.total_requests, metrics.last_updated, health_score)
+        return health_score
+    
+    def _compute_health_score(self) -> float:
+        """Compute health score from current metrics"""
         if self.metrics.total_requests == 0:
             return 0.5  # Neutral score for untested models
         
         # Success rate component (0-0.4)
-        success_rate = self.metrics.successful_requests / self.metrics.total_requests
+        success_rate = self.metrics.success_rate
         success_component = min(0.4, success_rate * 0.4)
         
         # Response time component (0-0.3)
@@ -349,8 +586,27 @@ class ModelVersion:
         health_score = success_component + response_time_component + confidence_component - error_penalty
         return max(0.0, min(1.0, health_score))
     
-    def should_rollback(self) -> tuple[bool, str]:
-        """Check if model should be rolled back based on performance criteria"""
+    def should_rollback(self, force: bool = False) -> tuple[bool, str]:
+        """Check if model should be rolled back based on performance criteria
+        
+        Unless forced, a result is reused until the metrics change and, after
+        that, for the deployment's rollback evaluation window.
+        """
+        deployment = self.current_deployment
+        rollback_cache = self._rollback_cache
+        if rollback_cache is not None and rollback_cache[0] is deployment:
+            if rollback_cache[1] == self._mutation_seq:
+                return rollback_cache[3]
+            if (not force and deployment is not None and
+                    time.monotonic_ns() - rollback_cache[2] < deployment.rollback_evaluation_window_minutes * 60_000_000_000):
+                return rollback_cache[3]
+        
+        result = self._evaluate_rollback()
+        self._rollback_cache = (deployment, self._mutation_seq, time.monotonic_ns(), result)
+        return result
+    
+    def _evaluate_rollback(self) -> tuple[bool, str]:
+        """Evaluate rollback criteria against current metrics"""
         if not self.current_deployment or not self.current_deployment.auto_rollback_enabled:
             return False, "Auto-rollback not enabled"
         
@@ -368,13 +624,22 @@ class ModelVersion:
         if self.metrics.avg_response_time > deployment.rollback_threshold_response_time:
             return True, f"Response time {self.metrics.avg_response_time:.2f}s exceeds threshold {deployment.rollback_threshold_response_time:.2f}s"
         
+        # Check tail latency when a p99 threshold is configured
+        p99_threshold = deployment.rollback_threshold_p99_response_time
+        if p99_threshold is not None and self.metrics.p99_response_time > p99_threshold:
+            return True, f"P99 response time {self.metrics.p99_response_time:.2f}s exceeds threshold {p99_threshold:.2f}s"
+        
         # Check success rate threshold
-        success_rate = self.metrics.successful_requests / self.metrics.total_requests
+        success_rate = self.metrics.success_rate
         if success_rate < deployment.min_success_rate:
             return True, f"Success rate {success_rate:.3f} below minimum {deployment.min_success_rate:.3f}"
         
         return False, "All metrics within acceptable thresholds"
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize model version to JSON bytes, using orjson when installed"""
+        return dumps_json_bytes(self.to_dict())
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert model version to dictionary"""
         return {
@@ -383,7 +648,7 @@ class ModelVersion:
             "name": self.name,
             "description": self.description,
             "configuration": self.configuration.to_dict(),
-            "status": self.status.value,
+            "status": STATUS_VALUES[self.status],
             "created_at": self.created_at,
             "created_by": self.created_by,
             "deployments": [d.to_dict() for d in self.deployments],
@@ -391,64 +656,54 @@ class ModelVersion:
             "metrics": self.metrics.to_dict(),
             "validation_results": self.validation_results,
             "test_results": self.test_results,
-            "changelog": self.changelog,
+            "changelog": list(self.changelog),
             "tags": self.tags,
             "parent_version": self.parent_version,
-            "child_versions": self.child_versions,
+            "child_versions": list(self.child_versions),
             "health_score": self.calculate_health_score()
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ModelVersion':
         """Create model version from dictionary"""
+        metrics_data = data.get("metrics")
         model_version = cls(
             model_id=data["model_id"],
             version=data["version"],
             name=data.get("name", ""),
             description=data.get("description", ""),
             configuration=ModelConfiguration.from_dict(data["configuration"]),
-            status=ModelStatus(data["status"]),
-            created_at=data.get("created_at", time.time()),
+            status=STATUS_BY_VALUE[data["status"]],
+            created_at=data["created_at"] if "created_at" in data else time.time(),
             created_by=data.get("created_by", "system"),
+            metrics=ModelMetrics.from_dict(metrics_data) if metrics_data is not None else ModelMetrics(),
             validation_results=data.get("validation_results", {}),
             test_results=data.get("test_results", {}),
-            changelog=data.get("changelog", []),
+            changelog=deque(data.get("changelog", ()), maxlen=MAX_CHANGELOG_ENTRIES),
             tags=data.get("tags", []),
             parent_version=data.get("parent_version"),
-            child_versions=data.get("child_versions", [])
+            child_versions=deque(data.get("child_versions", ()), maxlen=MAX_CHILD_VERSIONS)
         )
         
         # Restore deployments
-        for deployment_data in data.get("deployments", []):
-            deployment = ModelDeployment(**deployment_data)
-            deployment.status = ModelStatus(deployment_data["status"])
-            deployment.deployment_strategy = DeploymentStrategy(deployment_data["deployment_strategy"])
-            model_version.deployments.append(deployment)
-        
-        # Restore current deployment
-        if data.get("current_deployment"):
-            current_deployment_data = data["current_deployment"]
-            model_version.current_deployment = ModelDeployment(**current_deployment_data)
-            model_version.current_deployment.status = ModelStatus(current_deployment_data["status"])
-            model_version.current_deployment.deployment_strategy = DeploymentStrategy(current_deployment_data["deployment_strategy"])
+        deployments = model_version.deployments
+        strategy_counter = model_version._strategy_counter
+        for deployment_data in data.get("deployments", ()):
+            deployment = ModelDeployment.from_dict(deployment_data)
+            deployments.append(deployment)
+            strategy_counter[STRATEGY_VALUES[deployment.deployment_strategy]] += 1
+            if deployment.status == ModelStatus.ACTIVE:
+                model_version._active_deployment = deployment
         
-        # Restore metrics
-        if "metrics" in data:
-            metrics_data = data["metrics"]
-            model_version.metrics = ModelMetrics(
-                total_requests=metrics_data.get("total_requests", 0),
-                successful_requests=metrics_data.get("successful_requests", 0),
-                failed_requests=metrics_data.get("failed_requests", 0),
-                avg_response_time=metrics_data.get("avg_response_time", 0.0),
-                min_response_time=metrics_data.get("min_response_time", float('inf')),
-                max_response_time=metrics_data.get("max_response_time", 0.0),
-                avg_confidence_score=metrics_data.get("avg_confidence_score", 0.0),
-                cost_per_request=metrics_data.get("cost_per_request", 0.0),
-                total_cost=metrics_data.get("total_cost", 0.0),
-                error_rate=metrics_data.get("error_rate", 0.0),
-                first_request_time=metrics_data.get("first_request_time"),
-                last_request_time=metrics_data.get("last_request_time"),
-                last_updated=metrics_data.get("last_updated", time.time())
-            )
+        # Restore current deployment, sharing the matching entry in deployments as a live version does
+        current_deployment_data = data.get("current_deployment")
+        if current_deployment_data:
+            current_id = current_deployment_data.get("deployment_id")
+            for deployment in reversed(deployments):
+                if deployment.deployment_id == current_id:
+                    model_version.current_deployment = deployment
+                    break
+            else:
+                model_version.current_deployment = ModelDeployment.from_dict(current_deployment_data)
         
-        return model_version
\ No newline at end of file
+        return model_version
@@ -6,16 +6,34 @@ detecting degradation, and triggering automated responses.
 """
 
 import asyncio
+import operator
 import time
+from bisect import bisect_left, bisect_right, insort
 from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
-from collections import deque
 import structlog
 
+from .model_version import dumps_json_bytes
+
 logger = structlog.get_logger(__name__)
 
+# Sort key for the alert history
+_TRIGGERED_AT = operator.attrgetter("triggered_at")
+
+
+def _approx_equal(value: float, target: float) -> bool:
+    return abs(value - target) < 0.001
+
 
-@dataclass
+# Breach predicates for PerformanceThreshold.operator, resolved once per threshold
+THRESHOLD_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    "greater_than": operator.gt,
+    "less_than": operator.lt,
+    "equals": _approx_equal,
+}
+
+
+@dataclass(slots=True)
 class PerformanceThreshold:
     """Performance threshold configuration"""
     metric_name: str
@@ -24,9 +42,16 @@ class PerformanceThreshold:
     severity: str = "warning"  # info, warning, critical
     duration_minutes: int = 5  # How long threshold must be breached
     action: str = "alert"  # alert, rollback, scale
+    predicate: Callable[[float, float], bool] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        predicate = THRESHOLD_OPERATORS.get(self.operator)
+        if predicate is None:
+            raise ValueError(f"Unknown threshold operator: {self.operator}")
+        self.predicate = predicate
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceAlert:
     """Performance alert"""
     alert_id: str
@@ -38,6 +63,7 @@ class PerformanceAlert:
     triggered_at: float
     resolved_at: Optional[float] = None
     actions_taken: List[str] = field(default_factory=list)
+    _dict_cache: Optional[Tuple[int, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def is_active(self) -> bool:
@@ -52,7 +78,13 @@ class PerformanceAlert:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary"""
-        return {
+        # Once resolved an alert only changes if another action is noted, so
+        # its dictionary is built once and reused while actions_taken is unchanged
+        cached = self._dict_cache
+        if cached is not None and cached[0] == len(self.actions_taken):
+            return dict(cached[1])
+        
+        data = {
             "alert_id": self.alert_id,
             "model_name": self.model_name,
             "model_version": self.model_version,
@@ -67,9 +99,18 @@ class PerformanceAlert:
             "duration_minutes": self.duration_minutes,
             "actions_taken": self.actions_taken
         }
+        if self.resolved_at is not None:
+            self._dict_cache = (len(self.actions_taken), data)
+            return dict(data)
+        return data
+
+
+def alerts_to_json_bytes(alerts: List[PerformanceAlert]) -> bytes:
+    """Serialize a batch of alerts as a JSON array, using orjson when installed"""
+    return dumps_json_bytes([alert.to_dict() for alert in alerts])
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceBaseline:
     """Performance baseline for comparison"""
     model_name: str
@@ -97,6 +138,203 @@ class PerformanceBaseline:
         }
 
 
+class _MetricColumn:
+    """Timestamps, values and sample numbers of one metric, oldest first
+    
+    Parallel lists with a start offset: trimming the front only moves the
+    offset, and the lists are compacted once the dead prefix dominates.
+    Timestamps are non-decreasing (the owning series clamps them), so time
+    windows are found by bisection and come out as contiguous slices.
+    """
+    __slots__ = ("timestamps", "values", "samples", "start")
+    
+    def __init__(self):
+        self.timestamps: List[float] = []
+        self.values: List[float] = []
+        self.samples: List[int] = []  # series sample number of each value
+        self.start = 0
+    
+    def __len__(self) -> int:
+        return len(self.values) - self.start
+    
+    @property
+    def last_sample(self) -> int:
+        """Series sample number of the newest value, 0 if none was ever added"""
+        return self.samples[-1] if self.samples else 0
+    
+    def append(self, timestamp: float, value: float, sample: int):
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.samples.append(sample)
+    
+    def values_after(self, cutoff: float) -> List[float]:
+        """Values with timestamp > cutoff"""
+        return self.values[bisect_right(self.timestamps, cutoff, self.start):]
+    
+    def values_since(self, cutoff: float) -> Tuple[List[float], List[float]]:
+        """Timestamps and values with timestamp >= cutoff"""
+        index = bisect_left(self.timestamps, cutoff, self.start)
+        return self.timestamps[index:], self.values[index:]
+    
+    def values_before(self, cutoff: float) -> List[float]:
+        """Values with timestamp < cutoff"""
+        return self.values[self.start:bisect_left(self.timestamps, cutoff, self.start)]
+    
+    def drop_before(self, cutoff: float):
+        """Drop entries with timestamp < cutoff"""
+        self.start = bisect_left(self.timestamps, cutoff, self.start)
+        self._compact()
+    
+    def drop_through(self, sample: int):
+        """Drop entries with sample number <= sample"""
+        if self.start < len(self.samples) and self.samples[self.start] <= sample:
+            self.start = bisect_right(self.samples, sample, self.start)
+            self._compact()
+    
+    def _compact(self):
+        start = self.start
+        if start >= 1024 and start * 2 >= len(self.values):
+            del self.timestamps[:start]
+            del self.values[:start]
+            del self.samples[:start]
+            self.start = 0
+
+
+class _DriftTracker:
+    """Exponentially weighted mean/variance of one metric with two-sided CUSUM
+    
+    Updated in O(1) per sample. The CUSUM sums deviations from the EWMA mean
+    beyond a slack of ``slack`` standard deviations, so a sustained shift
+    accumulates while isolated spikes do not. It only starts accumulating
+    after ``warmup`` samples: before that the variance, which starts at zero,
+    is biased low and the allowance would be too small.
+    """
+    __slots__ = ("count", "mean", "variance", "cusum_high", "cusum_low", "last_score", "checked_count")
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.cusum_high = 0.0
+        self.cusum_low = 0.0
+        self.last_score = 0.0  # |x - mean| / std of the latest sample, before it was folded in
+        self.checked_count = 0  # count when last_score was last checked for anomalies
+    
+    def update(self, value: float, alpha: float, slack: float, warmup: int):
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        
+        deviation = value - self.mean
+        std = self.variance ** 0.5
+        if std > 0.0:
+            self.last_score = abs(deviation) / std
+            if self.count > warmup:
+                allowance = slack * std
+                cusum_high = self.cusum_high + deviation - allowance
+                self.cusum_high = cusum_high if cusum_high > 0.0 else 0.0
+                cusum_low = self.cusum_low - deviation - allowance
+                self.cusum_low = cusum_low if cusum_low > 0.0 else 0.0
+        else:
+            self.last_score = 0.0
+        
+        self.mean += alpha * deviation
+        self.variance = (1.0 - alpha) * (self.variance + alpha * deviation * deviation)
+    
+    def reset_cusum(self):
+        self.cusum_high = 0.0
+        self.cusum_low = 0.0
+
+
+class _PerformanceSeries:
+    """Columnar performance history for one model version"""
+    __slots__ = ("capacity", "records", "columns", "samples", "trackers", "drift_alpha", "drift_slack",
+                 "drift_warmup", "version", "current_cache")
+    
+    def __init__(self, capacity: int, drift_alpha: float, drift_slack: float, drift_warmup: int):
+        self.capacity = capacity
+        self.records = _MetricColumn()  # one entry per recorded sample; values unused
+        self.columns: Dict[str, _MetricColumn] = {}
+        self.samples = 0  # samples ever appended
+        self.trackers: Dict[str, _DriftTracker] = {}  # streaming stats, kept across cleanup
+        self.drift_alpha = drift_alpha
+        self.drift_slack = drift_slack
+        self.drift_warmup = drift_warmup
+        self.version = 0  # bumped whenever samples are added or dropped
+        
+        # Last recent-window aggregate: (version, cutoff, first timestamp after cutoff, metrics)
+        self.current_cache: Optional[Tuple[int, float, float, Dict[str, Any]]] = None
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def append(self, timestamp: float, metrics: Dict[str, float]):
+        self.version += 1
+        self.samples = sample = self.samples + 1
+        records = self.records
+        
+        # Windows are found by bisection, which needs non-decreasing timestamps;
+        # the wall clock can step backwards (NTP), so never go below the newest
+        if records.timestamps and timestamp < records.timestamps[-1]:
+            timestamp = records.timestamps[-1]
+        records.append(timestamp, 0.0, sample)
+        
+        columns = self.columns
+        trackers = self.trackers
+        drift_alpha = self.drift_alpha
+        drift_slack = self.drift_slack
+        drift_warmup = self.drift_warmup
+        for metric_name, value in metrics.items():
+            column = columns.get(metric_name)
+            if column is None:
+                column = columns[metric_name] = _MetricColumn()
+            column.append(timestamp, value, sample)
+            tracker = trackers.get(metric_name)
+            if tracker is None:
+                tracker = trackers[metric_name] = _DriftTracker()
+            tracker.update(value, drift_alpha, drift_slack, drift_warmup)
+        
+        # Keep only the newest `capacity` samples; their metrics leave with them
+        evicted = sample - self.capacity
+        if evicted > 0:
+            records.drop_through(evicted)
+            for metric_name, column in list(columns.items()):
+                column.drop_through(evicted)
+                if not column:
+                    del columns[metric_name]
+    
+    @property
+    def latest(self) -> Dict[str, float]:
+        """Metrics of the most recent sample"""
+        sample = self.samples
+        return {metric_name: column.values[-1]
+                for metric_name, column in self.columns.items()
+                if column.last_sample == sample and column}
+    
+    @property
+    def oldest_timestamp(self) -> float:
+        return self.records.timestamps[self.records.start]
+    
+    @property
+    def newest_timestamp(self) -> float:
+        return self.records.timestamps[-1]
+    
+    def first_timestamp_after(self, cutoff: float) -> float:
+        """Timestamp of the oldest sample newer than cutoff, or inf"""
+        records = self.records
+        index = bisect_right(records.timestamps, cutoff, records.start)
+        return records.timestamps[index] if index < len(records.timestamps) else float('inf')
+    
+    def drop_before(self, cutoff: float):
+        self.version += 1
+        self.records.drop_before(cutoff)
+        for metric_name, column in list(self.columns.items()):
+            column.drop_before(cutoff)
+            if not column:
+                del self.columns[metric_name]
+
+
 class ModelPerformanceMonitor:
     """Advanced performance monitoring for AI models"""
     
@@ -104,11 +342,11 @@ class ModelPerformanceMonitor:
         self.config = config or {}
         
         # Performance data storage
-        self._performance_data: Dict[str, deque] = {}  # model_version -> deque of metrics
+        self._performance_data: Dict[str, Dict[str, _PerformanceSeries]] = {}  # model_name -> version -> columnar history
         self._baselines: Dict[str, PerformanceBaseline] = {}  # model_name:metric -> baseline
         self._thresholds: Dict[str, List[PerformanceThreshold]] = {}  # model_name -> thresholds
         self._active_alerts: Dict[str, PerformanceAlert] = {}  # alert_id -> alert
-        self._alert_history: List[PerformanceAlert] = []
+        self._alert_history: List[PerformanceAlert] = []  # resolved alerts, sorted by triggered_at
         
         # Callback functions for actions
         self._alert_callbacks: List[Callable] = []
@@ -119,12 +357,21 @@ class ModelPerformanceMonitor:
         self._baseline_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
+        self._shutdown_waiter: Optional[asyncio.Task] = None  # shared by the loops' interval waits
         
         # Configuration
         self.data_retention_hours = self.config.get("data_retention_hours", 168)  # 1 week
         self.monitoring_interval_seconds = self.config.get("monitoring_interval_seconds", 60)
         self.baseline_calculation_interval_hours = self.config.get("baseline_calculation_interval_hours", 24)
         self.anomaly_sensitivity = self.config.get("anomaly_sensitivity", 2.0)
+        self.max_alert_history = self.config.get("max_alert_history", 10000)  # oldest resolved alerts dropped first
+        self.callback_timeout_seconds = self.config.get("callback_timeout_seconds", 5.0)  # per alert/rollback callback
+        
+        # Streaming drift detection (EWMA mean/variance + CUSUM), per model version and metric
+        self.drift_span = self.config.get("drift_span", 100)  # EWMA span in samples; also the warm-up
+        self.drift_slack = self.config.get("drift_slack", 0.5)  # CUSUM allowance, in standard deviations
+        self.drift_threshold = self.config.get("drift_threshold", 5.0)  # CUSUM alarm level, in standard deviations
+        self._drift_alpha = 2.0 / (self.drift_span + 1)
         
         logger.info("Model Performance Monitor initialized",
                    data_retention_hours=self.data_retention_hours,
@@ -133,6 +380,7 @@ class ModelPerformanceMonitor:
     async def start(self):
         """Start monitoring tasks"""
         try:
+            self._shutdown_waiter = asyncio.create_task(self._shutdown_event.wait())
             self._monitoring_task = asyncio.create_task(self._monitoring_loop())
             self._baseline_task = asyncio.create_task(self._baseline_calculation_loop())
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
@@ -149,7 +397,7 @@ class ModelPerformanceMonitor:
         
         self._shutdown_event.set()
         
-        for task in [self._monitoring_task, self._baseline_task, self._cleanup_task]:
+        for task in [self._monitoring_task, self._baseline_task, self._cleanup_task, self._shutdown_waiter]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -165,19 +413,18 @@ class ModelPerformanceMonitor:
                          metrics: Dict[str, float]):
         """Record performance metrics for a model version"""
         try:
-            model_key = f"{model_name}:{model_version}"
-            
             # Initialize storage if needed
-            if model_key not in self._performance_data:
-                self._performance_data[model_key] = deque(maxlen=10000)  # Limit memory usage
-            
-            # Add timestamp to metrics
-            metrics_with_timestamp = {
-                "timestamp": time.time(),
-                **metrics
-            }
+            versions = self._performance_data.get(model_name)
+            if versions is None:
+                versions = self._performance_data[model_name] = {}
+            series = versions.get(model_version)
+            if series is None:
+                series = versions[model_version] = _PerformanceSeries(
+                    capacity=10000, drift_alpha=self._drift_alpha, drift_slack=self.drift_slack,
+                    drift_warmup=self.drift_span)  # Limit memory usage
             
-            self._performance_data[model_key].append(metrics_with_timestamp)
+            # Values are copied into the columns; the caller's dict is not kept
+            series.append(time.time(), metrics)
             
             logger.debug("Performance metrics recorded",
                         model_name=model_name,
@@ -206,39 +453,25 @@ class ModelPerformanceMonitor:
         """Add callback function for rollbacks"""
         self._rollback_callbacks.append(callback)
     
+    def _get_series(self, model_name: str, model_version: str) -> Optional[_PerformanceSeries]:
+        """Get the recorded history for a model version, if any"""
+        versions = self._performance_data.get(model_name)
+        return versions.get(model_version) if versions is not None else None
+    
+    def _iter_series(self):
+        """Yield (model_name, model_version, series) for every recorded version"""
+        for model_name, versions in self._performance_data.items():
+            for model_version, series in versions.items():
+                yield model_name, model_version, series
+    
     def get_current_metrics(self, model_name: str, model_version: str) -> Dict[str, Any]:
         """Get current performance metrics for a model version"""
         try:
-            model_key = f"{model_name}:{model_version}"
-            
-            if model_key not in self._performance_data:
-                return {}
-            
-            data_points = list(self._performance_data[model_key])
-            if not data_points:
-                return {}
-            
-            # Calculate current metrics from recent data
-            recent_data = [dp for dp in data_points if time.time() - dp["timestamp"] < 3600]  # Last hour
-            
-            if not recent_data:
+            series = self._get_series(model_name, model_version)
+            if series is None:
                 return {}
             
-            # Calculate averages
-            metrics = {}
-            metric_names = set()
-            for dp in recent_data:
-                metric_names.update(k for k in dp.keys() if k != "timestamp")
-            
-            for metric_name in metric_names:
-                values = [dp[metric_name] for dp in recent_data if metric_name in dp]
-                if values:
-                    metrics[f"avg_{metric_name}"] = sum(values) / len(values)
-                    metrics[f"min_{metric_name}"] = min(values)
-                    metrics[f"max_{metric_name}"] = max(values)
-                    metrics[f"count_{metric_name}"] = len(values)
-            
-            return metrics
+            return dict(self._current_metrics(series, time.time() - 3600))
             
         except Exception as e:
             logger.error("Error getting current metrics",
@@ -247,50 +480,60 @@ class ModelPerformanceMonitor:
                         error=str(e))
             return {}
     
+    def _current_metrics(self, series: _PerformanceSeries, cutoff_time: float) -> Dict[str, Any]:
+        """Aggregate samples newer than cutoff_time; the result is shared, do not mutate
+        
+        The previous result still holds if no sample was added or dropped and
+        none has aged out of the window since.
+        """
+        current_cache = series.current_cache
+        if (current_cache is not None and current_cache[0] == series.version and
+                current_cache[1] <= cutoff_time < current_cache[2]):
+            return current_cache[3]
+        
+        metrics = {}
+        for metric_name, column in series.columns.items():
+            values = column.values_after(cutoff_time)
+            if values:
+                count = len(values)
+                metrics[f"avg_{metric_name}"] = sum(values) / count
+                metrics[f"min_{metric_name}"] = min(values)
+                metrics[f"max_{metric_name}"] = max(values)
+                metrics[f"count_{metric_name}"] = count
+        
+        series.current_cache = (series.version, cutoff_time, series.first_timestamp_after(cutoff_time), metrics)
+        return metrics
+    
     def get_performance_trends(self, 
                              model_name: str, 
                              model_version: str,
                              hours_back: int = 24) -> Dict[str, List[Dict[str, Any]]]:
         """Get performance trends over time"""
         try:
-            model_key = f"{model_name}:{model_version}"
-            
-            if model_key not in self._performance_data:
-                return {}
-            
-            # Filter data by time range
-            cutoff_time = time.time() - (hours_back * 3600)
-            data_points = [dp for dp in self._performance_data[model_key] 
-                          if dp["timestamp"] >= cutoff_time]
-            
-            if not data_points:
+            series = self._get_series(model_name, model_version)
+            if series is None:
                 return {}
             
             # Group data by time buckets (e.g., hourly)
+            cutoff_time = time.time() - (hours_back * 3600)
             bucket_size_seconds = 3600  # 1 hour buckets
             trends = {}
             
-            # Get all metric names
-            metric_names = set()
-            for dp in data_points:
-                metric_names.update(k for k in dp.keys() if k != "timestamp")
-            
             # Create time series for each metric
-            for metric_name in metric_names:
-                time_series = []
-                
-                # Group by time buckets
-                buckets = {}
-                for dp in data_points:
-                    if metric_name in dp:
-                        bucket_key = int(dp["timestamp"] // bucket_size_seconds)
-                        if bucket_key not in buckets:
-                            buckets[bucket_key] = []
-                        buckets[bucket_key].append(dp[metric_name])
+            for metric_name, column in series.columns.items():
+                timestamps, metric_values = column.values_since(cutoff_time)
+                if not metric_values:
+                    continue
                 
-                # Calculate averages for each bucket
-                for bucket_key in sorted(buckets.keys()):
-                    values = buckets[bucket_key]
+                # Timestamps are sorted, so each bucket is a contiguous run;
+                # find its end by bisection and reduce the slice in one go
+                time_series = []
+                index = 0
+                end = len(timestamps)
+                while index < end:
+                    bucket_key = int(timestamps[index] // bucket_size_seconds)
+                    bucket_end = bisect_left(timestamps, (bucket_key + 1) * bucket_size_seconds, index)
+                    values = metric_values[index:bucket_end]
                     time_series.append({
                         "timestamp": bucket_key * bucket_size_seconds,
                         "value": sum(values) / len(values),
@@ -298,6 +541,7 @@ class ModelPerformanceMonitor:
                         "min": min(values),
                         "max": max(values)
                     })
+                    index = bucket_end
                 
                 trends[metric_name] = time_series
             
@@ -320,26 +564,35 @@ class ModelPerformanceMonitor:
             }
             
             all_metrics = {}
+            cutoff_time = time.time() - 3600
             
             for version in versions:
-                version_metrics = self.get_current_metrics(model_name, version)
+                series = self._get_series(model_name, version)
+                version_metrics = dict(self._current_metrics(series, cutoff_time)) if series is not None else {}
                 comparison["versions"][version] = version_metrics
                 
                 # Collect all metric names
-                for metric_name in version_metrics:
-                    if metric_name not in all_metrics:
-                        all_metrics[metric_name] = {}
-                    all_metrics[metric_name][version] = version_metrics[metric_name]
+                for metric_name, value in version_metrics.items():
+                    version_values = all_metrics.get(metric_name)
+                    if version_values is None:
+                        version_values = all_metrics[metric_name] = {}
+                    version_values[version] = value
             
-            # Create summary comparisons
+            # Create summary comparisons; the extremes are found once per metric
+            # and reused for best/worst and the range
             for metric_name, version_values in all_metrics.items():
                 if len(version_values) > 1:
-                    values = list(version_values.values())
+                    highest = max(version_values, key=version_values.get)
+                    lowest = min(version_values, key=version_values.get)
+                    if "error" in metric_name:
+                        best_version, worst_version = lowest, highest
+                    else:
+                        best_version, worst_version = highest, lowest
                     comparison["summary"][metric_name] = {
-                        "best_version": max(version_values, key=version_values.get) if "error" not in metric_name else min(version_values, key=version_values.get),
-                        "worst_version": min(version_values, key=version_values.get) if "error" not in metric_name else max(version_values, key=version_values.get),
-                        "range": max(values) - min(values),
-                        "average": sum(values) / len(values)
+                        "best_version": best_version,
+                        "worst_version": worst_version,
+                        "range": version_values[highest] - version_values[lowest],
+                        "average": sum(version_values.values()) / len(version_values)
                     }
             
             return comparison
@@ -358,7 +611,17 @@ class ModelPerformanceMonitor:
     def get_alert_history(self, hours_back: int = 24) -> List[PerformanceAlert]:
         """Get alert history"""
         cutoff_time = time.time() - (hours_back * 3600)
-        return [alert for alert in self._alert_history if alert.triggered_at >= cutoff_time]
+        return self._alert_history[bisect_left(self._alert_history, cutoff_time, key=_TRIGGERED_AT):]
+    
+    def _archive_alert(self, alert: PerformanceAlert):
+        """Move a resolved alert into history, keeping it ordered by trigger time"""
+        # Alerts resolve out of trigger order, but usually land at or near the end
+        insort(self._alert_history, alert, key=_TRIGGERED_AT)
+        
+        # Bound history between cleanups by dropping the oldest-triggered alerts
+        excess = len(self._alert_history) - self.max_alert_history
+        if excess > 0:
+            del self._alert_history[:excess]
     
     def resolve_alert(self, alert_id: str, resolution_note: str = ""):
         """Manually resolve an alert"""
@@ -369,7 +632,7 @@ class ModelPerformanceMonitor:
                 alert.actions_taken.append(f"Manually resolved: {resolution_note}")
                 
                 # Move to history
-                self._alert_history.append(alert)
+                self._archive_alert(alert)
                 del self._active_alerts[alert_id]
                 
                 logger.info("Alert resolved",
@@ -386,40 +649,45 @@ class ModelPerformanceMonitor:
             logger.error("Error resolving alert", alert_id=alert_id, error=str(e))
             return False
     
+    async def _wait_for_shutdown(self, timeout: float):
+        """Wait up to timeout seconds, returning early when stop() is called
+        
+        asyncio.wait leaves the shared waiter task pending on timeout, so a
+        quiet tick neither creates a task nor raises TimeoutError.
+        """
+        if self._shutdown_waiter is None:
+            self._shutdown_waiter = asyncio.create_task(self._shutdown_event.wait())
+        await asyncio.wait((self._shutdown_waiter,), timeout=timeout)
+    
     async def _monitoring_loop(self):
         """Main monitoring loop"""
         while not self._shutdown_event.is_set():
             try:
-                await self._check_thresholds()
+                # One timestamp per tick so every alert raised or resolved in it agrees on "now"
+                await self._check_thresholds(time.time())
                 await self._detect_anomalies()
                 
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=self.monitoring_interval_seconds
-                )
+                await self._wait_for_shutdown(self.monitoring_interval_seconds)
                 
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logger.error("Monitoring loop error", error=str(e))
                 await asyncio.sleep(60)
     
-    async def _check_thresholds(self):
+    async def _check_thresholds(self, now: Optional[float] = None):
         """Check performance thresholds for all models"""
+        if now is None:
+            now = time.time()
+        cutoff_time = now - 3600
+        
         for model_name, thresholds in self._thresholds.items():
             try:
-                # Get all versions of this model
-                model_versions = []
-                for model_key in self._performance_data.keys():
-                    if model_key.startswith(f"{model_name}:"):
-                        version = model_key.split(":", 1)[1]
-                        model_versions.append(version)
-                
-                for version in model_versions:
-                    current_metrics = self.get_current_metrics(model_name, version)
+                # Aggregate each version of this model once and evaluate every
+                # threshold against the shared (uncopied) result
+                for version, series in list(self._performance_data.get(model_name, {}).items()):
+                    current_metrics = self._current_metrics(series, cutoff_time)
                     
                     for threshold in thresholds:
-                        await self._evaluate_threshold(model_name, version, threshold, current_metrics)
+                        await self._evaluate_threshold(model_name, version, threshold, current_metrics, now)
             
             except Exception as e:
                 logger.error("Error checking thresholds",
@@ -430,7 +698,8 @@ class ModelPerformanceMonitor:
                                 model_name: str,
                                 model_version: str,
                                 threshold: PerformanceThreshold,
-                                current_metrics: Dict[str, float]):
+                                current_metrics: Dict[str, float],
+                                now: float):
         """Evaluate a specific threshold"""
         try:
             metric_key = f"avg_{threshold.metric_name}"
@@ -438,15 +707,9 @@ class ModelPerformanceMonitor:
                 return
             
             current_value = current_metrics[metric_key]
-            is_breached = False
             
             # Check threshold condition
-            if threshold.operator == "greater_than":
-                is_breached = current_value > threshold.threshold_value
-            elif threshold.operator == "less_than":
-                is_breached = current_value < threshold.threshold_value
-            elif threshold.operator == "equals":
-                is_breached = abs(current_value - threshold.threshold_value) < 0.001
+            is_breached = threshold.predicate(current_value, threshold.threshold_value)
             
             alert_id = f"{model_name}:{model_version}:{threshold.metric_name}"
             
@@ -461,7 +724,7 @@ class ModelPerformanceMonitor:
                         metric_name=threshold.metric_name,
                         threshold=threshold,
                         current_value=current_value,
-                        triggered_at=time.time()
+                        triggered_at=now
                     )
                     
                     self._active_alerts[alert_id] = alert
@@ -485,11 +748,11 @@ class ModelPerformanceMonitor:
                 # Threshold not breached, resolve alert if it exists
                 if alert_id in self._active_alerts:
                     alert = self._active_alerts[alert_id]
-                    alert.resolved_at = time.time()
+                    alert.resolved_at = now
                     alert.actions_taken.append("Threshold condition resolved")
                     
                     # Move to history
-                    self._alert_history.append(alert)
+                    self._archive_alert(alert)
                     del self._active_alerts[alert_id]
                     
                     logger.info("Performance alert resolved",
@@ -503,22 +766,15 @@ class ModelPerformanceMonitor:
                         error=str(e))
     
     async def _detect_anomalies(self):
-        """Detect performance anomalies using baselines"""
+        """Detect performance anomalies using baselines, or the streaming statistics
+        where no baseline exists yet, and report sustained drift from the CUSUM"""
         try:
-            for model_key, data_points in self._performance_data.items():
-                if not data_points:
+            for model_name, model_version, series in self._iter_series():
+                if not series:
                     continue
                 
-                model_name, model_version = model_key.split(":", 1)
-                
-                # Get recent data point
-                recent_data = list(data_points)[-1]
-                
-                # Check each metric against baseline
-                for metric_name, value in recent_data.items():
-                    if metric_name == "timestamp":
-                        continue
-                    
+                # Check each metric of the most recent data point against baseline
+                for metric_name, value in series.latest.items():
                     baseline_key = f"{model_name}:{metric_name}"
                     if baseline_key in self._baselines:
                         baseline = self._baselines[baseline_key]
@@ -531,6 +787,35 @@ class ModelPerformanceMonitor:
                                          current_value=value,
                                          baseline_value=baseline.baseline_value,
                                          deviation=abs(value - baseline.baseline_value))
+                        continue
+                    
+                    # Score each sample once; later ticks without new data would repeat it
+                    tracker = series.trackers.get(metric_name)
+                    if tracker is None or tracker.checked_count == tracker.count:
+                        continue
+                    tracker.checked_count = tracker.count
+                    if tracker.count >= self.drift_span and tracker.last_score > self.anomaly_sensitivity:
+                        logger.warning("Performance anomaly detected",
+                                     model_name=model_name,
+                                     model_version=model_version,
+                                     metric_name=metric_name,
+                                     current_value=value,
+                                     baseline_value=tracker.mean,
+                                     deviation=abs(value - tracker.mean))
+                
+                # Sustained drift since the last check
+                for metric_name, tracker in series.trackers.items():
+                    if tracker.count < self.drift_span:
+                        continue
+                    limit = self.drift_threshold * tracker.variance ** 0.5
+                    if tracker.cusum_high > limit or tracker.cusum_low > limit:
+                        logger.warning("Performance drift detected",
+                                     model_name=model_name,
+                                     model_version=model_version,
+                                     metric_name=metric_name,
+                                     direction="up" if tracker.cusum_high > limit else "down",
+                                     ewma_mean=tracker.mean)
+                        tracker.reset_cusum()
         
         except Exception as e:
             logger.error("Error detecting anomalies", error=str(e))
@@ -542,21 +827,17 @@ class ModelPerformanceMonitor:
             
             if action == "alert":
                 # Execute alert callbacks
-                for callback in self._alert_callbacks:
-                    try:
-                        await callback(alert)
-                        alert.actions_taken.append("Alert notification sent")
-                    except Exception as e:
-                        logger.error("Error executing alert callback", error=str(e))
+                await self._run_callbacks(alert, self._alert_callbacks, (alert,),
+                                          "Alert notification sent",
+                                          "Error executing alert callback")
             
             elif action == "rollback":
                 # Execute rollback callbacks
-                for callback in self._rollback_callbacks:
-                    try:
-                        await callback(alert.model_name, alert.model_version, f"Performance threshold breached: {alert.metric_name}")
-                        alert.actions_taken.append("Rollback triggered")
-                    except Exception as e:
-                        logger.error("Error executing rollback callback", error=str(e))
+                await self._run_callbacks(alert, self._rollback_callbacks,
+                                          (alert.model_name, alert.model_version,
+                                           f"Performance threshold breached: {alert.metric_name}"),
+                                          "Rollback triggered",
+                                          "Error executing rollback callback")
             
             elif action == "scale":
                 # Placeholder for scaling actions
@@ -569,19 +850,35 @@ class ModelPerformanceMonitor:
                         alert_id=alert.alert_id,
                         error=str(e))
     
+    async def _run_callbacks(self,
+                             alert: PerformanceAlert,
+                             callbacks: List[Callable],
+                             args: Tuple[Any, ...],
+                             action_note: str,
+                             error_message: str):
+        """Run callbacks concurrently, each bounded by callback_timeout_seconds"""
+        async def run(callback):
+            return await asyncio.wait_for(callback(*args), timeout=self.callback_timeout_seconds)
+        
+        # A slow or failing callback no longer delays the others
+        results = await asyncio.gather(*(run(callback) for callback in callbacks), return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(error_message,
+                           alert_id=alert.alert_id,
+                           error=str(result) or type(result).__name__)
+            else:
+                alert.actions_taken.append(action_note)
+    
     async def _baseline_calculation_loop(self):
         """Calculate performance baselines periodically"""
         while not self._shutdown_event.is_set():
             try:
                 await self._calculate_baselines()
                 
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=self.baseline_calculation_interval_hours * 3600
-                )
+                await self._wait_for_shutdown(self.baseline_calculation_interval_hours * 3600)
                 
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logger.error("Baseline calculation loop error", error=str(e))
                 await asyncio.sleep(3600)
@@ -589,26 +886,18 @@ class ModelPerformanceMonitor:
     async def _calculate_baselines(self):
         """Calculate performance baselines for all models"""
         try:
-            for model_key, data_points in self._performance_data.items():
-                if len(data_points) < 100:  # Need minimum sample size
+            for model_name, _, series in self._iter_series():
+                if len(series) < 100:  # Need minimum sample size
                     continue
                 
-                model_name = model_key.split(":", 1)[0]
-                
                 # Get historical data (exclude recent 24 hours for stability)
                 cutoff_time = time.time() - (24 * 3600)
-                historical_data = [dp for dp in data_points if dp["timestamp"] < cutoff_time]
-                
-                if len(historical_data) < 100:
+                if len(series.records.values_before(cutoff_time)) < 100:
                     continue
                 
                 # Calculate baselines for each metric
-                metric_names = set()
-                for dp in historical_data:
-                    metric_names.update(k for k in dp.keys() if k != "timestamp")
-                
-                for metric_name in metric_names:
-                    values = [dp[metric_name] for dp in historical_data if metric_name in dp]
+                for metric_name, column in series.columns.items():
+                    values = column.values_before(cutoff_time)
                     
                     if len(values) >= 100:
                         baseline = self._calculate_metric_baseline(model_name, metric_name, values)
@@ -627,9 +916,12 @@ class ModelPerformanceMonitor:
     def _calculate_metric_baseline(self, model_name: str, metric_name: str, values: List[float]) -> PerformanceBaseline:
         """Calculate baseline statistics for a metric"""
         try:
+            # Mean, then the sum of squared deviations (stable, unlike a
+            # sum-of-squares shortcut); squaring runs in C via map
             n = len(values)
             mean = sum(values) / n
-            variance = sum((x - mean) ** 2 for x in values) / (n - 1)
+            deviations = [x - mean for x in values]
+            variance = sum(map(operator.mul, deviations, deviations)) / (n - 1)
             std = variance ** 0.5
             
             # Calculate confidence interval (95%)
@@ -666,39 +958,47 @@ class ModelPerformanceMonitor:
         """Clean up old data periodically"""
         while not self._shutdown_event.is_set():
             try:
-                await self._cleanup_old_data()
+                await self._cleanup_old_data(time.time())
                 
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=3600  # Run every hour
-                )
+                await self._wait_for_shutdown(3600)  # Run every hour
                 
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logger.error("Cleanup loop error", error=str(e))
                 await asyncio.sleep(3600)
     
-    async def _cleanup_old_data(self):
+    async def _cleanup_old_data(self, now: Optional[float] = None):
         """Clean up old performance data"""
         try:
-            cutoff_time = time.time() - (self.data_retention_hours * 3600)
+            if now is None:
+                now = time.time()
+            cutoff_time = now - (self.data_retention_hours * 3600)
             
             # Clean performance data
-            for model_key in list(self._performance_data.keys()):
-                data_points = self._performance_data[model_key]
-                # Filter out old data points
-                new_data = deque((dp for dp in data_points if dp["timestamp"] >= cutoff_time), 
-                               maxlen=data_points.maxlen)
-                self._performance_data[model_key] = new_data
+            for model_name in list(self._performance_data.keys()):
+                versions = self._performance_data[model_name]
+                for model_version in list(versions.keys()):
+                    series = versions[model_version]
+                    # Drop old data points from the front of each column
+                    series.drop_before(cutoff_time)
+                    
+                    # Remove empty entries
+                    if not series:
+                        del versions[model_version]
                 
-                # Remove empty entries
-                if not new_data:
-                    del self._performance_data[model_key]
+                if not versions:
+                    del self._performance_data[model_name]
+            
+            # Expire active alerts whose model version no longer has any data;
+            # nothing will evaluate (and so resolve) them again
+            for alert_id, alert in list(self._active_alerts.items()):
+                if self._get_series(alert.model_name, alert.model_version) is None:
+                    alert.resolved_at = now
+                    alert.actions_taken.append("Expired: no performance data retained")
+                    self._archive_alert(alert)
+                    del self._active_alerts[alert_id]
             
             # Clean alert history
-            self._alert_history = [alert for alert in self._alert_history 
-                                 if alert.triggered_at >= cutoff_time]
+            del self._alert_history[:bisect_left(self._alert_history, cutoff_time, key=_TRIGGERED_AT)]
             
             logger.debug("Performance data cleanup completed",
                         cutoff_time=cutoff_time)
@@ -711,18 +1011,33 @@ class ModelPerformanceMonitor:
         try:
             current_time = time.time()
             
+            # One pass over the series for the counts and the time span
+            version_count = 0
+            total_data_points = 0
+            oldest = newest = None
+            for _, _, series in self._iter_series():
+                version_count += 1
+                if not series:
+                    continue
+                total_data_points += len(series)
+                if oldest is None or series.oldest_timestamp < oldest:
+                    oldest = series.oldest_timestamp
+                if newest is None or series.newest_timestamp > newest:
+                    newest = series.newest_timestamp
+            
             return {
-                "models_monitored": len(set(key.split(":", 1)[0] for key in self._performance_data.keys())),
-                "model_versions_monitored": len(self._performance_data),
-                "total_data_points": sum(len(data) for data in self._performance_data.values()),
+                "models_monitored": len(self._performance_data),
+                "model_versions_monitored": version_count,
+                "total_data_points": total_data_points,
                 "active_alerts": len(self._active_alerts),
                 "total_thresholds": sum(len(thresholds) for thresholds in self._thresholds.values()),
                 "baselines_calculated": len(self._baselines),
                 "alert_history_count": len(self._alert_history),
+                "max_alert_history": self.max_alert_history,
                 "data_retention_hours": self.data_retention_hours,
                 "monitoring_interval_seconds": self.monitoring_interval_seconds,
-                "oldest_data_point": min((min(dp["timestamp"] for dp in data) for data in self._performance_data.values() if data), default=current_time),
-                "newest_data_point": max((max(dp["timestamp"] for dp in data) for data in self._performance_data.values() if data), default=current_time)
+                "oldest_data_point": oldest if oldest is not None else current_time,
+                "newest_data_point": newest if newest is not None else current_time
             }
         
         except Exception as e:
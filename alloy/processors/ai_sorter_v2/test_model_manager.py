@@ -0,0 +1,164 @@
+import pytest
+
+from models import model_manager
+from models.model_manager import ModelManagerConfig, ModelVersionManager
+from models.model_version import ModelConfiguration
+
+
+def make_manager(storage_path):
+    return ModelVersionManager(ModelManagerConfig(storage_path=str(storage_path)))
+
+
+async def create_version(manager, model_name, version, deploy=False):
+    model_version = await manager.create_model_version(
+        model_name, version, ModelConfiguration("grok", model_name, version)
+    )
+    if deploy:
+        await manager.deploy_model_version(model_name, version)
+    return model_version
+
+
+@pytest.mark.asyncio
+async def test_model_statistics_are_not_shared_between_callers(tmp_path):
+    """Mutating one statistics result does not affect the next call"""
+    manager = make_manager(tmp_path)
+    await create_version(manager, "m", "1.0.0", deploy=True)
+
+    stats = manager.get_model_statistics()
+    stats.pop("models")
+    stats["total_models"] = 42
+
+    again = manager.get_model_statistics()
+    assert again["total_models"] == 1
+    assert "m" in again["models"]
+
+
+@pytest.mark.asyncio
+async def test_model_statistics_follow_live_metrics(tmp_path):
+    """Per-request totals are current on every call"""
+    manager = make_manager(tmp_path)
+    await create_version(manager, "m", "1.0.0", deploy=True)
+    manager.get_model_statistics()
+
+    await manager.update_model_metrics("m", "1.0.0", 0.5, True, 0.9, 0.01)
+
+    assert manager.get_model_statistics()["models"]["m"]["total_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reload_defers_inactive_versions(tmp_path):
+    """Only active versions are parsed at startup; others load on first access"""
+    manager = make_manager(tmp_path)
+    for version in ("1", "2", "3"):
+        await create_version(manager, "m", version)
+    await manager.deploy_model_version("m", "2")
+
+    reloaded = make_manager(tmp_path)
+    assert reloaded.get_active_model("m").version == "2"
+    assert len(reloaded._models["m"]) == 1
+
+    assert reloaded.get_model_version("m", "3").version == "3"
+    assert sorted(v.version for v in reloaded.list_model_versions("m")) == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_deferred_loading_keeps_prefixed_model_names_apart(tmp_path):
+    """Listing "foo" does not pull in files of "foo_bar", whose stems share its prefix"""
+    manager = make_manager(tmp_path)
+    await create_version(manager, "foo", "1", deploy=True)
+    await create_version(manager, "foo", "2")
+    await create_version(manager, "foo_bar", "1", deploy=True)
+    await create_version(manager, "foo_bar", "2")
+
+    reloaded = make_manager(tmp_path)
+    assert sorted(v.version for v in reloaded.list_model_versions("foo")) == ["1", "2"]
+    assert len(reloaded._models["foo_bar"]) == 1
+    assert reloaded.get_model_version("foo", "bar_2") is None
+
+    assert sorted(v.version for v in reloaded.list_model_versions("foo_bar")) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_reload_keys_versions_by_registry_name(tmp_path):
+    """A registry name that differs from the provider model name survives a restart"""
+    manager = make_manager(tmp_path)
+    for version in ("1.0", "1.1"):
+        await manager.create_model_version(
+            "telemetry-classifier", version, ModelConfiguration("openai", "gpt-4", version)
+        )
+    await manager.deploy_model_version("telemetry-classifier", "1.1")
+
+    reloaded = make_manager(tmp_path)
+    assert reloaded.get_active_model("telemetry-classifier").version == "1.1"
+    assert reloaded.get_model_version("telemetry-classifier", "1.0").version == "1.0"
+    assert "gpt-4" not in reloaded.list_all_models()
+
+
+@pytest.mark.asyncio
+async def test_model_summary_reports_latest_version_by_registry_name(tmp_path):
+    """The latest-version pointer is found under the name the model was registered with"""
+    manager = make_manager(tmp_path)
+    for version in ("1.0", "1.1"):
+        await manager.create_model_version(
+            "telemetry-classifier", version, ModelConfiguration("openai", "gpt-4", version)
+        )
+
+    assert manager.get_model_summary("telemetry-classifier")["latest_version"] == "1.1"
+
+
+@pytest.mark.asyncio
+async def test_reload_renames_files_named_after_provider_model(tmp_path):
+    """Files from stores that used the provider model name as stem are moved once"""
+    manager = make_manager(tmp_path)
+    model_version = await manager.create_model_version(
+        "telemetry-classifier", "1.0", ModelConfiguration("openai", "gpt-4", "1.0")
+    )
+    await manager.deploy_model_version("telemetry-classifier", "1.0")
+    model_file = next((tmp_path / "models").iterdir())
+    model_file.rename(model_file.with_name(f"gpt-4_1.0{model_file.suffix}"))
+    (tmp_path / "catalog.json").unlink()
+
+    reloaded = make_manager(tmp_path)
+    assert reloaded.get_active_model("telemetry-classifier").version == "1.0"
+    assert [f.stem for f in (tmp_path / "models").iterdir()] == [model_version.storage_stem]
+
+
+@pytest.mark.asyncio
+async def test_reload_without_indexes_scans_and_rewrites_them(tmp_path):
+    """Stores without the active index or catalog are fully scanned once"""
+    manager = make_manager(tmp_path)
+    await create_version(manager, "m", "1", deploy=True)
+    await create_version(manager, "m", "2")
+    (tmp_path / "catalog.json").unlink()
+
+    reloaded = make_manager(tmp_path)
+    assert len(reloaded.list_all_models()["m"]) == 2
+    assert reloaded.get_active_model("m").version == "1"
+    assert (tmp_path / "catalog.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_json_store_migrates_to_msgpack_on_save(tmp_path, monkeypatch):
+    """JSON files from a store without msgpack are read, then replaced on the next save"""
+    msgpack = pytest.importorskip("msgpack")
+    monkeypatch.setattr(model_manager, "msgpack", None)
+    manager = make_manager(tmp_path)
+    await create_version(manager, "m", "1")
+    await create_version(manager, "m", "2", deploy=True)
+    models_dir = tmp_path / "models"
+    assert sorted(f.suffix for f in models_dir.iterdir()) == [".json", ".json"]
+
+    monkeypatch.setattr(model_manager, "msgpack", msgpack)
+    migrated = make_manager(tmp_path)
+    await migrated.update_model_metrics("m", "2", 0.5, True, 0.9, 0.01)
+    active = migrated.get_active_model("m")
+    await migrated._save_model_version(active)
+
+    stem = active.storage_stem
+    assert (models_dir / f"{stem}.mpk").exists()
+    assert not (models_dir / f"{stem}.json").exists()
+
+    reloaded = make_manager(tmp_path)
+    assert reloaded.get_active_model("m").metrics.total_requests == 1
+    assert reloaded.get_model_version("m", "1").version == "1"
+    assert reloaded.get_active_model("m").to_dict() == active.to_dict()
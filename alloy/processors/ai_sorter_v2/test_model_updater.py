@@ -0,0 +1,144 @@
+import pytest
+from structlog.testing import capture_logs
+
+from models import model_updater
+from models.ab_testing import ABTestEngine
+from models.model_manager import ModelManagerConfig, ModelVersionManager
+from models.model_updater import (
+    ModelUpdate,
+    ModelUpdateAutomation,
+    UpdateStatus,
+    UpdateTrigger,
+    ValidationResult,
+    ValidationRule,
+)
+from models.model_version import DeploymentStrategy
+
+
+@pytest.fixture
+def automation(tmp_path):
+    manager = ModelVersionManager(ModelManagerConfig(storage_path=str(tmp_path)))
+    return ModelUpdateAutomation(manager, ABTestEngine(), {})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock for the updater module"""
+    class Clock:
+        now = 1_700_000_000.0
+
+    monkeypatch.setattr(model_updater.time, "time", lambda: Clock.now)
+    return Clock
+
+
+@pytest.mark.asyncio
+async def test_late_wakeup_runs_schedule_once(automation, clock, monkeypatch):
+    """A scheduler that wakes up days late fires one update, not one per missed slot"""
+    monkeypatch.setattr(model_updater, "croniter", None)
+    schedule_id = automation.schedule_update("m", "2.0.0", "0 */6 * * *")
+
+    clock.now += 3 * 86400
+    await automation._check_scheduled_updates()
+    await automation._check_scheduled_updates()
+
+    assert len(automation.list_updates(model_name="m")) == 1
+    assert automation._scheduled_updates[schedule_id].next_run > clock.now
+
+
+@pytest.mark.asyncio
+async def test_late_wakeup_with_croniter_skips_missed_runs(automation, clock):
+    """With croniter, the next run is computed from the wake-up time"""
+    pytest.importorskip("croniter")
+    schedule_id = automation.schedule_update("m", "2.0.0", "0 * * * *")
+
+    clock.now += 10 * 3600 + 60
+    await automation._check_scheduled_updates()
+    await automation._check_scheduled_updates()
+
+    next_run = automation._scheduled_updates[schedule_id].next_run
+    assert len(automation.list_updates(model_name="m")) == 1
+    assert clock.now < next_run <= clock.now + 3600
+
+
+@pytest.mark.asyncio
+async def test_scheduler_fires_only_due_enabled_schedules(automation, clock, monkeypatch):
+    """Each check runs the schedules whose next run has passed, skipping disabled ones"""
+    monkeypatch.setattr(model_updater, "croniter", None)
+    automation.schedule_update("daily", "2.0.0", "0 0 * * *")
+    automation.schedule_update("six_hourly", "2.0.0", "0 */6 * * *")
+    disabled_id = automation.schedule_update("disabled", "2.0.0", "0 */6 * * *")
+    automation._scheduled_updates[disabled_id].enabled = False
+
+    def triggered():
+        return sorted(u["model_name"] for u in automation.list_updates())
+
+    clock.now += 6 * 3600 + 1
+    await automation._check_scheduled_updates()
+    assert triggered() == ["six_hourly"]
+
+    clock.now += 18 * 3600
+    await automation._check_scheduled_updates()
+    assert triggered() == ["daily", "six_hourly", "six_hourly"]
+
+
+def test_cancel_without_completed_history(tmp_path):
+    """With max_completed_history 0, finished updates are dropped instead of failing"""
+    manager = ModelVersionManager(ModelManagerConfig(storage_path=str(tmp_path)))
+    automation = ModelUpdateAutomation(manager, ABTestEngine(), {"max_completed_history": 0})
+    update_id = automation.trigger_update("m", "2.0.0")
+
+    assert automation.cancel_update(update_id)
+    assert automation.get_update_status(update_id) is None
+    assert automation.list_updates() == []
+
+
+def test_validation_passed_follows_replaced_rules():
+    """Swapping a required rule for an optional one (same count) changes the outcome"""
+    update = ModelUpdate(
+        update_id="u-1",
+        model_name="m",
+        current_version="1.0.0",
+        target_version="2.0.0",
+        trigger=UpdateTrigger.MANUAL,
+        deployment_strategy=DeploymentStrategy.REPLACE,
+        validation_rules=[ValidationRule("smoke", "smoke test", "smoke", required=True)],
+    )
+    update.validation_results = [ValidationResult("smoke", False, "failed", 0.1)]
+    assert not update.validation_passed
+
+    update.validation_rules[0] = ValidationRule("smoke", "smoke test", "smoke", required=False)
+    assert update.validation_passed
+
+
+def test_list_updates_limit_returns_newest_first(automation):
+    """A limited listing is the head of the full newest-first listing"""
+    created_at = {}
+    for offset, version in zip((3, 1, 4, 0, 2), "abcde"):
+        update_id = automation.trigger_update("m", version)
+        automation._update_by_id[update_id].created_at = 1_700_000_000.0 + offset
+        created_at[update_id] = offset
+    automation.trigger_update("other", "z")
+
+    listed = automation.list_updates(model_name="m")
+    assert [created_at[u["update_id"]] for u in listed] == [4, 3, 2, 1, 0]
+    assert automation.list_updates(model_name="m", limit=3) == listed[:3]
+    assert automation.list_updates(model_name="m", limit=10) == listed
+    assert automation.list_updates(model_name="m", status=UpdateStatus.PENDING, limit=2) == listed[:2]
+    assert len(automation.list_updates(limit=2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_validation_rule_emits_debug_event(automation):
+    """Per-rule debug events reach structlog regardless of the stdlib root level"""
+    update = ModelUpdate(
+        update_id="u-1",
+        model_name="m",
+        current_version="1.0.0",
+        target_version="2.0.0",
+        trigger=UpdateTrigger.MANUAL,
+        deployment_strategy=DeploymentStrategy.REPLACE,
+    )
+    with capture_logs() as events:
+        await automation._run_validation_rule(update, ValidationRule("missing", "missing", "missing"))
+
+    assert any(e["event"] == "Validation rule completed" and e["log_level"] == "debug" for e in events)
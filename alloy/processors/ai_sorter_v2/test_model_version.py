@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from models.model_version import (
+    ModelConfiguration,
+    ModelDeployment,
+    ModelMetrics,
+    ModelStatus,
+    ModelVersion,
+    P2Quantile,
+)
+
+
+@pytest.fixture
+def model_version():
+    return ModelVersion(
+        model_id="m-1",
+        version="1.0.0",
+        name="classifier",
+        description="test model",
+        configuration=ModelConfiguration("grok", "classifier", "1.0.0"),
+    )
+
+
+def test_to_dict_reflects_direct_field_changes(model_version):
+    """Edits made straight on nested objects show up in the next serialization"""
+    deployment = ModelDeployment(traffic_percentage=10.0)
+    model_version.add_deployment(deployment)
+    model_version.to_dict()
+
+    deployment.traffic_percentage = 50.0
+    model_version.metrics.total_requests = 7
+    model_version.configuration.temperature = 0.9
+
+    data = model_version.to_dict()
+    assert data["deployments"][0]["traffic_percentage"] == 50.0
+    assert data["metrics"]["total_requests"] == 7
+    assert data["configuration"]["temperature"] == 0.9
+
+
+def test_to_dict_result_is_not_shared(model_version):
+    """Mutating a returned payload does not leak into later calls"""
+    data = model_version.to_dict()
+    data["metrics"]["total_requests"] = 999
+    data["tags"] = ["mutated"]
+
+    again = model_version.to_dict()
+    assert again["metrics"]["total_requests"] == 0
+    assert again["tags"] == []
+
+
+def exact_percentile(values, quantile):
+    ordered = sorted(values)
+    return ordered[int(round(quantile * (len(ordered) - 1)))]
+
+
+@pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+def test_p2_quantile_tracks_exact_percentile(quantile):
+    """The streaming estimate stays close to the exact percentile"""
+    rng = random.Random(42)
+    values = [rng.lognormvariate(0, 0.5) for _ in range(20000)]
+    estimator = P2Quantile(quantile)
+    for value in values:
+        estimator.add(value)
+
+    exact = exact_percentile(values, quantile)
+    assert estimator.value() == pytest.approx(exact, rel=0.05)
+
+
+def test_p2_quantile_is_exact_below_five_samples():
+    """Fewer than five observations are answered from the raw values"""
+    estimator = P2Quantile(0.5)
+    assert estimator.value() == 0.0
+    for value in (3.0, 1.0, 2.0):
+        estimator.add(value)
+    assert estimator.value() == 2.0
+
+
+def test_metrics_round_trip_keeps_tail_estimators():
+    """A reloaded metrics object continues the p99 estimate instead of restarting"""
+    rng = random.Random(7)
+    metrics = ModelMetrics()
+    for _ in range(1000):
+        metrics.update_request_metrics(rng.uniform(0.1, 1.0), True)
+
+    restored = ModelMetrics.from_dict(metrics.to_dict())
+    for _ in range(1000):
+        response_time = rng.uniform(0.1, 1.0)
+        metrics.update_request_metrics(response_time, True)
+        restored.update_request_metrics(response_time, True)
+
+    assert restored.p99_response_time == metrics.p99_response_time
+    assert restored.p95_response_time == metrics.p95_response_time
+
+
+def test_p99_rollback_gate_is_opt_in(model_version):
+    """Tail latency only triggers a rollback once its own threshold is set"""
+    model_version.add_deployment(ModelDeployment(status=ModelStatus.ACTIVE))
+    for i in range(200):
+        model_version.update_metrics(30.0 if i % 20 == 0 else 1.0, True)
+
+    assert model_version.metrics.p99_response_time > 10.0
+    assert model_version.should_rollback(force=True) == (False, "All metrics within acceptable thresholds")
+
+    model_version.add_deployment(ModelDeployment(
+        status=ModelStatus.ACTIVE, rollback_threshold_p99_response_time=20.0
+    ))
+    should_rollback, reason = model_version.should_rollback(force=True)
+    assert should_rollback
+    assert reason.startswith("P99")
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+from structlog.testing import capture_logs
+
+from models import performance_monitor
+from models.performance_monitor import ModelPerformanceMonitor, _PerformanceSeries
+
+
+def make_series(capacity):
+    return _PerformanceSeries(capacity=capacity, drift_alpha=0.1, drift_slack=0.5, drift_warmup=19)
+
+
+def test_series_keeps_newest_samples_up_to_capacity():
+    """Evicting a sample also drops its per-metric values"""
+    series = make_series(capacity=3)
+    series.append(1.0, {"latency": 1.0, "cost": 0.5})
+    for timestamp in (2.0, 3.0, 4.0):
+        series.append(timestamp, {"latency": timestamp})
+
+    assert len(series) == 3
+    assert series.oldest_timestamp == 2.0
+    assert series.columns["latency"].values_after(0.0) == [2.0, 3.0, 4.0]
+    assert "cost" not in series.columns
+
+
+def test_series_eviction_is_by_sample_not_timestamp():
+    """Samples sharing a timestamp are evicted one at a time"""
+    series = make_series(capacity=2)
+    for value in (1.0, 2.0, 3.0):
+        series.append(5.0, {"latency": value})
+
+    assert series.columns["latency"].values_after(0.0) == [2.0, 3.0]
+
+
+def test_series_window_queries_and_expiry():
+    """Time windows are contiguous slices; expired samples are dropped"""
+    series = make_series(capacity=100)
+    for timestamp in range(10):
+        series.append(float(timestamp), {"latency": timestamp * 10.0})
+    column = series.columns["latency"]
+
+    assert column.values_after(6.0) == [70.0, 80.0, 90.0]
+    assert column.values_before(2.0) == [0.0, 10.0]
+    assert column.values_since(8.0) == ([8.0, 9.0], [80.0, 90.0])
+
+    series.drop_before(5.0)
+    assert len(series) == 5
+    assert column.values_after(0.0) == [50.0, 60.0, 70.0, 80.0, 90.0]
+
+    series.drop_before(100.0)
+    assert len(series) == 0
+    assert series.columns == {}
+
+
+def test_series_clamps_backward_timestamps():
+    """A clock step backwards cannot break the ordering bisection relies on"""
+    series = make_series(capacity=100)
+    series.append(10.0, {"latency": 1.0})
+    series.append(5.0, {"latency": 2.0})
+    series.append(11.0, {"latency": 3.0})
+
+    column = series.columns["latency"]
+    assert column.timestamps == [10.0, 10.0, 11.0]
+    assert column.values_after(9.0) == [1.0, 2.0, 3.0]
+    assert series.latest == {"latency": 3.0}
+
+
+def test_record_performance_emits_debug_event():
+    """Debug events reach structlog regardless of the stdlib root level"""
+    monitor = ModelPerformanceMonitor()
+    with capture_logs() as events:
+        monitor.record_performance("m", "1.0", {"latency": 1.0})
+
+    assert {"event": "Performance metrics recorded", "log_level": "debug", "model_name": "m",
+            "model_version": "1.0", "metrics": ["latency"]} in events
+
+
+class RecordingLogger:
+    """Stand-in for the module logger that keeps warning events"""
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, event, **kwargs):
+        self.warnings.append(event)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.mark.asyncio
+async def test_streaming_anomaly_is_reported_once_per_sample(monkeypatch):
+    """Ticks without new data do not repeat the previous sample's anomaly"""
+    log = RecordingLogger()
+    monkeypatch.setattr(performance_monitor, "logger", log)
+    monitor = ModelPerformanceMonitor({"drift_span": 10})
+    for i in range(20):
+        monitor.record_performance("m", "1.0", {"latency": 1.0 + (i % 2) * 0.01})
+    monitor.record_performance("m", "1.0", {"latency": 50.0})
+
+    await monitor._detect_anomalies()
+    await monitor._detect_anomalies()
+    assert log.warnings.count("Performance anomaly detected") == 1
+
+    monitor.record_performance("m", "1.0", {"latency": 500.0})
+    await monitor._detect_anomalies()
+    assert log.warnings.count("Performance anomaly detected") == 2
+
+
+@pytest.mark.asyncio
+async def test_no_drift_alarm_when_warmup_ends_on_stationary_input(monkeypatch):
+    """Samples seen while the variance estimate warms up do not feed the CUSUM"""
+    log = RecordingLogger()
+    monkeypatch.setattr(performance_monitor, "logger", log)
+    monitor = ModelPerformanceMonitor()
+    rng = random.Random(3)
+    for version in range(50):
+        for _ in range(monitor.drift_span):
+            monitor.record_performance("m", str(version), {"latency": rng.gauss(100.0, 10.0)})
+
+    await monitor._detect_anomalies()
+    assert "Performance drift detected" not in log.warnings